@@ -3,7 +3,7 @@ Global Logging Service with Decorator Support
 """
 import threading
 from functools import wraps
-from typing import Callable, Optional, Any
+from typing import Callable, Optional, Any, Dict, Tuple
 from datetime import datetime
 import inspect
 
@@ -15,22 +15,26 @@ class LogLevel:
     ERROR = 'ERROR'
 
 
+# Guards singleton construction only - log calls never take it
+_singleton_lock = threading.Lock()
+
+
 class Logger:
     """Global logger service"""
     
     _instance: Optional['Logger'] = None
-    _lock = threading.Lock()
     
     def __init__(self):
         self._enabled = True
         self._level = LogLevel.INFO
         self._output_handler: Optional[Callable[[str], None]] = None
+        self._prefix_cache: Dict[Tuple[str, Optional[str]], str] = {}
         
     @classmethod
     def get_instance(cls) -> 'Logger':
         """Get singleton logger instance"""
         if cls._instance is None:
-            with cls._lock:
+            with _singleton_lock:
                 if cls._instance is None:
                     cls._instance = Logger()
         return cls._instance
@@ -49,8 +53,14 @@ class Logger:
             return
             
         timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-        component_str = f'[{component}]' if component else ''
-        formatted_msg = f'{timestamp} {level} {component_str} {message}'
+        
+        # Level/component prefixes repeat on every call - build each one once
+        key = (level, component)
+        prefix = self._prefix_cache.get(key)
+        if prefix is None:
+            prefix = f'{level} [{component}] ' if component else f'{level} '
+            self._prefix_cache[key] = prefix
+        formatted_msg = timestamp + ' ' + prefix + message
         
         if self._output_handler:
             self._output_handler(formatted_msg)
@@ -1,10 +1,57 @@
 # cv/calibration.py
 # Calibration decorator for camera manager
+import io
+import os
+import zipfile
 import numpy as np
+from collections import OrderedDict
 from functools import wraps
 from typing import Optional, Tuple
 
 
+_CALIBRATION_CACHE_SIZE = 16
+_calibration_cache: "OrderedDict[tuple, Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+
+
+def _calibration_key(file_path: str) -> tuple:
+    stat = os.stat(file_path)
+    return (file_path, stat.st_mtime_ns, stat.st_size)
+
+
+def _cache_calibration(key: tuple, camera_matrix: np.ndarray,
+                       dist_coeffs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Store read-only contiguous copies under key, evicting the oldest entry"""
+    arrays = (np.array(camera_matrix, order='C'), np.array(dist_coeffs, order='C'))
+    for array in arrays:
+        array.setflags(write=False)
+    
+    _calibration_cache[key] = arrays
+    if len(_calibration_cache) > _CALIBRATION_CACHE_SIZE:
+        _calibration_cache.popitem(last=False)
+    return arrays
+
+
+def _read_calibration(file_path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Parse a calibration .npz once per (path, mtime, size) - cached arrays are read-only"""
+    key = _calibration_key(file_path)
+    
+    cached = _calibration_cache.get(key)
+    if cached is not None:
+        _calibration_cache.move_to_end(key)
+        return cached
+    
+    # Read the small archive in one go and parse members straight from memory -
+    # skips NpzFile's lazy per-member ZipExtFile streams
+    with open(file_path, 'rb') as f:
+        payload = f.read()
+    with zipfile.ZipFile(io.BytesIO(payload)) as archive:
+        camera_matrix, dist_coeffs = (
+            np.lib.format.read_array(io.BytesIO(archive.read(name)), allow_pickle=False)
+            for name in ("camera_matrix.npy", "dist_coeffs.npy")
+        )
+    return _cache_calibration(key, camera_matrix, dist_coeffs)
+
+
 def calibration_aware():
     """
     Decorator that injects calibration capabilities into a class.
@@ -47,9 +94,10 @@ def calibration_aware():
         def load_calibration(self, file_path: str) -> bool:
             """Load camera calibration from .npz file"""
             try:
-                data = np.load(file_path)
-                self.camera_matrix = data["camera_matrix"]
-                self.dist_coeffs = data["dist_coeffs"]
+                camera_matrix, dist_coeffs = _read_calibration(file_path)
+                # Own writable copies - the cached arrays are shared
+                self.camera_matrix = camera_matrix.copy()
+                self.dist_coeffs = dist_coeffs.copy()
                 self._calibration_file = file_path
                 
                 # Emit event if event system available
@@ -78,6 +126,16 @@ def calibration_aware():
                         dist_coeffs=self.dist_coeffs)
                 self._calibration_file = file_path
                 
+                # Write-through: a load of the file just saved skips the zip parse
+                # (np.savez appends .npz to other names, so only cache exact paths -
+                # one stat() both checks the file exists and builds the key)
+                try:
+                    key = _calibration_key(file_path)
+                except FileNotFoundError:
+                    key = None
+                if key is not None:
+                    _cache_calibration(key, self.camera_matrix, self.dist_coeffs)
+                
                 # Emit event if event system available
                 if hasattr(self, 'emit'):
                     from .events import CameraEvents
@@ -101,14 +159,17 @@ def calibration_aware():
         
         def get_calibration_info(self) -> dict:
             """Get calibration information"""
+            # Built fresh each call - the arrays are public and may be reassigned
+            calibrated = self.is_calibrated()
             info = {
-                'calibrated': self.is_calibrated(),
+                'calibrated': calibrated,
                 'file': self._calibration_file
             }
             
-            if self.is_calibrated():
+            if calibrated:
+                dist_shape = self.dist_coeffs.shape
                 info['matrix_shape'] = self.camera_matrix.shape
-                info['distortion_count'] = self.dist_coeffs.shape[1] if self.dist_coeffs.ndim > 1 else self.dist_coeffs.shape[0]
+                info['distortion_count'] = dist_shape[1] if len(dist_shape) > 1 else dist_shape[0]
             
             return info
         
@@ -29,8 +29,8 @@ class ICVCapture(ABC):
     """Interface for frame capture"""
     
     @abstractmethod
-    def capture_frame(self) -> Optional[np.ndarray]:
-        """Capture a single frame from camera"""
+    def capture_frame(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """Capture a single frame from camera (optionally into a reusable buffer)"""
         pass
 
 
@@ -2,6 +2,7 @@
 # Camera Manager - Lean hardware management with explicit decorator application
 import cv2
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List
 
 from .interfaces import ICVConnection, ICVCapture, ICVHardware
@@ -15,11 +16,14 @@ class CameraManagerCore(ICVConnection, ICVCapture, ICVHardware):
     No decorators applied - base implementation
     """
     
+    CAMERA_PROBE_WORKERS = 4  # Concurrent device opens in list_cameras()
+    
     def __init__(self, camera_id: int = 0, resolution: tuple = (640, 480)):
         self.camera_id = camera_id
         self.resolution = resolution
         self.cap = None
         self._is_connected = False
+        self.emit_frame_events = True  # Opt out to skip the per-frame copy + publish
 
     @property
     def is_connected(self) -> bool:
@@ -28,24 +32,29 @@ class CameraManagerCore(ICVConnection, ICVCapture, ICVHardware):
 
     def list_cameras(self) -> List[Dict[str, Any]]:
         """List available cameras by testing indices 0-9"""
-        cameras = []
-        
-        for i in range(10):
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
-                ret, frame = cap.read()
-                if ret and frame is not None:
-                    backend = self._get_backend_name(cap)
-                    cameras.append({
-                        'index': i,
-                        'name': f'Camera {i}',
-                        'backend': backend,
-                        'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
-                        'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                    })
-                cap.release()
-        
-        return cameras
+        # Each probe blocks on the device open - probe several indices at once
+        with ThreadPoolExecutor(max_workers=self.CAMERA_PROBE_WORKERS) as pool:
+            probes = pool.map(self._probe_camera, range(10))
+            return [camera for camera in probes if camera is not None]
+
+    def _probe_camera(self, index: int) -> Optional[Dict[str, Any]]:
+        """Open one index, grab a frame and describe it - None if unusable"""
+        cap = cv2.VideoCapture(index)
+        try:
+            if not cap.isOpened():
+                return None
+            ret, frame = cap.read()
+            if not ret or frame is None:
+                return None
+            return {
+                'index': index,
+                'name': f'Camera {index}',
+                'backend': self._get_backend_name(cap),
+                'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            }
+        finally:
+            cap.release()
 
     def _get_backend_name(self, cap) -> str:
         """Get backend name from capture object"""
@@ -113,15 +122,15 @@ class CameraManagerCore(ICVConnection, ICVCapture, ICVHardware):
         if was_connected and hasattr(self, 'emit'):
             self.emit(CameraEvents.DISCONNECTED)
 
-    def capture_frame(self) -> Optional[np.ndarray]:
-        """Capture a single frame"""
+    def capture_frame(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """Capture a single frame - decoded into out when its shape/dtype match"""
         if not self.cap or not self._is_connected:
             return None
         
         try:
-            ret, frame = self.cap.read()
+            ret, frame = self.cap.read(out)
             if ret and frame is not None:
-                if hasattr(self, 'emit'):
+                if self.emit_frame_events and hasattr(self, 'emit'):
                     self.emit(CameraEvents.FRAME_CAPTURED, frame.copy())
                 return frame
             else:
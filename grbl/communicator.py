@@ -5,7 +5,7 @@ import threading
 import time
 import queue
 from concurrent.futures import Future
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Union
 from .serial import SerialConnection
 from .parser import GRBLResponseParser
 
@@ -13,6 +13,11 @@ from .parser import GRBLResponseParser
 class GRBLCommunicator:
     """Manages GRBL communication with async response handling"""
     
+    __slots__ = ('_serial', '_parser', '_reader_thread', '_running',
+                 '_response_queue', '_pending_commands', '_command_counter',
+                 '_status_callback', '_async_callback', 'last_command_ns',
+                 '_startup_event')
+    
     def __init__(self, serial_conn: SerialConnection, parser: GRBLResponseParser):
         self._serial = serial_conn
         self._parser = parser
@@ -25,6 +30,8 @@ class GRBLCommunicator:
         self._response_queue = queue.Queue()
         self._pending_commands = {}  # command_id -> Future
         self._command_counter = 0
+        self.last_command_ns = 0  # monotonic_ns of the last command/realtime write
+        self._startup_event = threading.Event()  # Set when the 'Grbl x.y' banner arrives
         
         # Callbacks for async messages
         self._status_callback: Optional[Callable] = None
@@ -53,7 +60,7 @@ class GRBLCommunicator:
             self._reader_thread.join(timeout=1.0)
             self._reader_thread = None
     
-    def send_command_sync(self, command: str, timeout: float = 5.0) -> List[str]:
+    def send_command_sync(self, command: Union[str, bytes], timeout: float = 5.0) -> List[str]:
         """Send command synchronously and wait for response"""
         future = self.send_command_async(command, timeout)
         try:
@@ -62,24 +69,28 @@ class GRBLCommunicator:
             # Timeout already handled by reader loop
             raise
     
-    def send_command_async(self, command: str, timeout: float = 5.0) -> Future:
-        """Send command asynchronously"""
+    def send_command_async(self, command: Union[str, bytes], timeout: float = 5.0) -> Future:
+        """Send command asynchronously - bytes commands are written as-is"""
         if not self._serial.is_open():
             raise ConnectionError("Serial not connected")
         
         future = Future()
         command_id = self._get_next_command_id()
+        self.last_command_ns = time.monotonic_ns()
         
         # Track the command
         self._pending_commands[command_id] = {
             'future': future,
-            'timeout': time.time() + timeout,
+            'timeout': time.monotonic() + timeout,
             'command': command
         }
         
         try:
             # Send command without ID injection to avoid interfering with GRBL
-            self._serial.write(f"{command}\n".encode())
+            if isinstance(command, bytes):
+                self._serial.write(command + b'\n')
+            else:
+                self._serial.write((command + '\n').encode())
             return future
         except Exception as e:
             if command_id in self._pending_commands:
@@ -87,11 +98,12 @@ class GRBLCommunicator:
             future.set_exception(e)
             return future
     
-    def send_realtime_command(self, command: str) -> None:
+    def send_realtime_command(self, command: Union[str, bytes]) -> None:
         """Send realtime command (no response expected)"""
         if not self._serial.is_open():
             raise ConnectionError("Serial not connected")
-        self._serial.write(command.encode())
+        self.last_command_ns = time.monotonic_ns()
+        self._serial.write(command if isinstance(command, bytes) else command.encode())
     
     def query_status(self, timeout: float = 2.0) -> Optional[dict]:
         """Query status with realtime command and wait for status response"""
@@ -123,6 +135,14 @@ class GRBLCommunicator:
             # Restore original callback
             self._status_callback = old_callback
     
+    def clear_startup(self) -> None:
+        """Forget any earlier startup banner - call before a soft reset"""
+        self._startup_event.clear()
+    
+    def wait_for_startup(self, timeout: float = 3.0) -> bool:
+        """Wait for the GRBL startup banner printed once a reset completes"""
+        return self._startup_event.wait(timeout)
+    
     def set_status_callback(self, callback: Callable) -> None:
         """Set callback for status updates"""
         self._status_callback = callback
@@ -134,32 +154,36 @@ class GRBLCommunicator:
     def _reader_loop(self) -> None:
         """Main reader loop - processes all incoming data with minimal latency"""
         responses_buffer = []
-        last_timeout_check = time.time()
+        last_timeout_check = time.monotonic()
         
         while self._running and self._serial.is_open():
             try:
                 # Check if data is available before blocking read
                 if self._serial.in_waiting() > 0:
-                    # Data available - read immediately with short timeout
-                    line = self._serial.read_line(timeout=0.05)
-                    
-                    if line:
-                        # Process data immediately when it arrives
-                        if self._parser.is_ok_response(line):
+                    # Data available - drain it in one read and handle every complete line
+                    for raw_line in self._serial.read_lines_bytes(timeout=0.05):
+                        if not raw_line:
+                            continue
+                        
+                        # Process data immediately when it arrives - one scan classifies the line
+                        kind, status_data = self._parser.classify(raw_line)
+                        if kind == GRBLResponseParser.LINE_STATUS:
+                            # Status response - parsed from bytes, no decode needed
+                            if status_data and self._status_callback:
+                                self._status_callback(status_data)
+                            continue
+                        
+                        # Decode once for the response list
+                        line = raw_line.decode('utf-8', errors='ignore')
+                        
+                        if kind == GRBLResponseParser.LINE_OK or kind == GRBLResponseParser.LINE_ERROR:
                             self._handle_command_completion(responses_buffer + [line])
                             responses_buffer.clear()
                             
-                        elif self._parser.is_error_response(line):
-                            self._handle_command_completion(responses_buffer + [line])
-                            responses_buffer.clear()
+                        elif self._parser.is_grbl_startup(line):
+                            # Reset finished - not part of any command's response
+                            self._startup_event.set()
                             
-                        elif line.startswith('<') and line.endswith('>'):
-                            # Status response - handle immediately
-                            if self._status_callback:
-                                status_data = self._parser.parse_status_response(line)
-                                if status_data:
-                                    self._status_callback(status_data)
-                                    
                         elif self._parser.is_async_message(line):
                             # Async message - handle immediately  
                             if self._async_callback:
@@ -173,7 +197,7 @@ class GRBLCommunicator:
                     time.sleep(0.001)  # 1ms
                     
                     # Check timeouts periodically (every 100ms)
-                    current_time = time.time()
+                    current_time = time.monotonic()
                     if current_time - last_timeout_check >= 0.1:
                         self._check_timeouts()
                         last_timeout_check = current_time
@@ -188,7 +212,7 @@ class GRBLCommunicator:
         if not self._pending_commands:
             return
             
-        current_time = time.time()
+        current_time = time.monotonic()
         timed_out = []
         
         for cmd_id, cmd_info in self._pending_commands.items():
@@ -1,7 +1,6 @@
 """
 GRBL Configuration Parser - Extracts machine parameters from GRBL settings
 """
-import re
 from typing import Dict, Optional
 from dataclasses import dataclass
 
@@ -65,13 +64,17 @@ class GRBLConfigParser:
         """Parse GRBL $$ output into machine configuration"""
         config = GRBLMachineConfig()
         
+        attr_for = self.SETTING_MAP.get  # Bound once for the whole response
         for line in settings_response:
-            match = re.match(r'(\$\d+)=([\d.]+)', line.strip())
-            if match:
-                setting_id, value = match.groups()
-                if setting_id in self.SETTING_MAP:
-                    attr_name = self.SETTING_MAP[setting_id]
-                    setattr(config, attr_name, float(value))
+            # "$N=value" - Grbl 0.9 appends " (description)" after the value
+            setting_id, sep, value = line.strip().partition('=')
+            attr_name = attr_for(setting_id) if sep else None
+            if attr_name is None:
+                continue
+            try:
+                setattr(config, attr_name, float(value.partition(' ')[0]))
+            except ValueError:
+                continue
         
         return config
     
@@ -2,6 +2,7 @@
 Refactored GRBL Controller - Following SOLID Principles
 Orchestrates components, maintains same interface as original
 """
+import threading
 import time
 from concurrent.futures import Future
 from typing import List, Optional
@@ -19,6 +20,27 @@ from .events import GRBLEvents
 class GRBLController(IGRBLConnection, IGRBLStatus, IGRBLMovement, IGRBLCommunication):
     """Refactored GRBL Controller following SOLID principles"""
 
+    # Fixed attribute layout - includes the ones injected by @event_aware/@log_aware
+    __slots__ = ('_event_broker', '_subscriptions', '_component_name',
+                 '_serial', '_parser', '_communicator',
+                 '_send_sync', '_send_async', '_send_rt',
+                 '_is_connected', 'current_position', 'current_status', '_work_offsets',
+                 '_status_stamp_ns', '_idle_event',
+                 '__weakref__')  # Weak listeners still work - no per-instance __dict__
+
+    # Prebuilt G-code formatters for motion commands
+    MOVE_FORMAT = "G0 X{:.3f} Y{:.3f} Z{:.3f}".format
+    MOVE_FEED_FORMAT = "G0 X{:.3f} Y{:.3f} Z{:.3f} F{}".format
+    JOG_FORMAT = "$J=G91 X{:.3f} Y{:.3f} Z{:.3f} F{}".format
+
+    # get_status() reuses a reply this recent unless a command was sent since
+    STATUS_TTL_NS = 20_000_000  # 20ms
+
+    # wait_for_idle() asks for reports 5ms apart at first, backing off to 10Hz
+    STATUS_REPORT_MIN_INTERVAL = 0.005
+    STATUS_REPORT_INTERVAL = 0.1
+    SETTLED_STATES = ('Idle', 'Alarm')
+
     def __init__(self, serial_conn: Optional[SerialConnection] = None, 
                  parser: Optional[GRBLResponseParser] = None):
         # Dependency injection (with defaults for single implementer)
@@ -26,11 +48,18 @@ class GRBLController(IGRBLConnection, IGRBLStatus, IGRBLMovement, IGRBLCommunica
         self._parser = parser or GRBLResponseParser()
         self._communicator = GRBLCommunicator(self._serial, self._parser)
         
+        # Bound once - every command goes through one of these
+        self._send_sync = self._communicator.send_command_sync
+        self._send_async = self._communicator.send_command_async
+        self._send_rt = self._communicator.send_realtime_command
+        
         # State tracking
         self._is_connected = False
         self.current_position = [0.0, 0.0, 0.0]
         self.current_status = "Unknown"
         self._work_offsets = [0.0, 0.0, 0.0]  # Current work coordinate offset
+        self._status_stamp_ns = 0  # When current_status was last queried (0 = stale)
+        self._idle_event = threading.Event()  # Set by the reader on a settled report
         
         # Setup callbacks
         self._communicator.set_status_callback(self._handle_status_update)
@@ -64,7 +93,7 @@ class GRBLController(IGRBLConnection, IGRBLStatus, IGRBLMovement, IGRBLCommunica
                     # Clear Hold state if present (prevents command execution)
                     if self.current_status.startswith('Hold'):
                         self.info(f"Machine in {self.current_status} state - clearing hold")
-                        self._communicator.send_realtime_command("~")  # Resume
+                        self._send_rt("~")  # Resume
                         time.sleep(0.1)  # Brief wait for state change
                         
                         # Verify hold cleared
@@ -77,7 +106,7 @@ class GRBLController(IGRBLConnection, IGRBLStatus, IGRBLMovement, IGRBLCommunica
                     if self.current_status == 'Alarm':
                         self.info(f"Machine in Alarm state - unlocking")
                         try:
-                            response = self._communicator.send_command_sync("$X", timeout=2.0)
+                            response = self._send_sync("$X", timeout=2.0)
                             if any(self._parser.is_ok_response(r) for r in response):
                                 time.sleep(0.2)
                                 # Verify alarm cleared
@@ -151,9 +180,7 @@ class GRBLController(IGRBLConnection, IGRBLStatus, IGRBLMovement, IGRBLCommunica
         
         # Query status and get position - fast timeout for ESP32
         try:
-            status_data = self._communicator.query_status(timeout=0.5)
-            if status_data and 'machine_position' in status_data:
-                self.current_position = status_data['machine_position']
+            if self._refresh_status():
                 return self.current_position.copy()
             else:
                 raise Exception("No status response")
@@ -166,20 +193,63 @@ class GRBLController(IGRBLConnection, IGRBLStatus, IGRBLMovement, IGRBLCommunica
             return "Disconnected"
         
         try:
-            status_data = self._communicator.query_status(timeout=0.5)
-            if status_data and 'state' in status_data:
-                self.current_status = status_data['state']
+            if self._refresh_status():
                 return self.current_status
             else:
                 return "Unknown"
         except:
             return "Unknown"
 
+    def _refresh_status(self) -> bool:
+        """Update state and position from one status report
+        
+        A report younger than STATUS_TTL_NS is reused unless a command was
+        written since, so get_status()/get_position() pairs and tight polling
+        loops share a single '?' round-trip.
+        """
+        now = time.monotonic_ns()
+        stamp = self._status_stamp_ns
+        if now - stamp < self.STATUS_TTL_NS and self._communicator.last_command_ns < stamp:
+            return True
+        
+        status_data = self._communicator.query_status(timeout=0.5)
+        if not status_data or 'state' not in status_data:
+            return False
+        
+        self.current_status = status_data['state']
+        if 'machine_position' in status_data:
+            self.current_position = status_data['machine_position']
+        self._status_stamp_ns = now
+        return True
+
+    def wait_for_idle(self, timeout: float = 30.0) -> bool:
+        """Block until a status report says Idle
+        
+        The reader thread sets an Event when a settled report arrives, so the
+        caller sleeps on it. '?' requests keep reports coming - quickly at
+        first so short moves are seen promptly, backing off x1.5 to
+        STATUS_REPORT_INTERVAL for long ones. Returns False on timeout or Alarm.
+        """
+        if not self.is_connected():
+            return False
+        
+        idle = self._idle_event
+        idle.clear()
+        deadline = time.monotonic() + timeout
+        interval = self.STATUS_REPORT_MIN_INTERVAL
+        self._send_rt("?")
+        while not idle.wait(interval):
+            if time.monotonic() >= deadline:
+                return False
+            self._send_rt("?")
+            interval = min(interval * 1.5, self.STATUS_REPORT_INTERVAL)
+        return self.current_status == 'Idle'
+
     # IGRBLMovement Interface
     def home(self) -> bool:
         """Perform homing cycle"""
         try:
-            response = self._communicator.send_command_sync("$H", timeout=30.0)
+            response = self._send_sync("$H", timeout=30.0)
             return any(self._parser.is_ok_response(r) for r in response)
         except Exception as e:
             self.error(f"Homing failed: {e}")
@@ -189,11 +259,11 @@ class GRBLController(IGRBLConnection, IGRBLStatus, IGRBLMovement, IGRBLCommunica
         """Move to absolute position"""
         try:
             if feed_rate:
-                command = f"G0 X{x:.3f} Y{y:.3f} Z{z:.3f} F{feed_rate}"
+                command = self.MOVE_FEED_FORMAT(x, y, z, feed_rate)
             else:
-                command = f"G0 X{x:.3f} Y{y:.3f} Z{z:.3f}"
+                command = self.MOVE_FORMAT(x, y, z)
             
-            response = self._communicator.send_command_sync(command, timeout=30.0)
+            response = self._send_sync(command, timeout=30.0)
             return any(self._parser.is_ok_response(r) for r in response)
         except Exception as e:
             self.error(f"Move failed: {e}")
@@ -202,8 +272,8 @@ class GRBLController(IGRBLConnection, IGRBLStatus, IGRBLMovement, IGRBLCommunica
     def jog_relative(self, x: float = 0, y: float = 0, z: float = 0, feed_rate: float = 1000) -> bool:
         """Jog relative to current position"""
         try:
-            command = f"$J=G91 X{x:.3f} Y{y:.3f} Z{z:.3f} F{feed_rate}"
-            response = self._communicator.send_command_sync(command, timeout=10.0)
+            command = self.JOG_FORMAT(x, y, z, feed_rate)
+            response = self._send_sync(command, timeout=10.0)
             return any(self._parser.is_ok_response(r) for r in response)
         except Exception as e:
             self.error(f"Jog failed: {e}")
@@ -212,7 +282,7 @@ class GRBLController(IGRBLConnection, IGRBLStatus, IGRBLMovement, IGRBLCommunica
     def emergency_stop(self) -> bool:
         """Emergency stop"""
         try:
-            self._communicator.send_realtime_command("!")
+            self._send_rt("!")
             return True
         except Exception as e:
             self.error(f"Emergency stop failed: {e}")
@@ -221,26 +291,32 @@ class GRBLController(IGRBLConnection, IGRBLStatus, IGRBLMovement, IGRBLCommunica
     def resume(self) -> bool:
         """Resume from hold"""
         try:
-            self._communicator.send_realtime_command("~")
+            self._send_rt("~")
             return True
         except Exception as e:
             self.error(f"Resume failed: {e}")
             return False
 
     def reset(self) -> bool:
-        """Soft reset GRBL"""
+        """Soft reset GRBL - returns once the startup banner is printed"""
         try:
-            self._communicator.send_realtime_command("")  # Ctrl-X
-            time.sleep(2)
+            self._communicator.clear_startup()
+            self._send_rt("")  # Ctrl-X
+            if not self.wait_for_startup_banner():
+                self.warning("No startup banner after reset")
             return True
         except Exception as e:
             self.error(f"Reset failed: {e}")
             return False
 
+    def wait_for_startup_banner(self, timeout: float = 3.0) -> bool:
+        """Block until GRBL prints its 'Grbl x.y' banner after a reset"""
+        return self._communicator.wait_for_startup(timeout)
+
     def unlock(self) -> bool:
         """Unlock GRBL from alarm state ($X command)"""
         try:
-            response = self._communicator.send_command_sync("$X", timeout=2.0)
+            response = self._send_sync("$X", timeout=2.0)
             return any(self._parser.is_ok_response(r) for r in response)
         except Exception as e:
             self.error(f"Unlock failed: {e}")
@@ -253,7 +329,7 @@ class GRBLController(IGRBLConnection, IGRBLStatus, IGRBLMovement, IGRBLCommunica
             raise Exception("GRBL not connected")
         
         timeout = timeout or 5.0
-        return self._communicator.send_command_sync(command, timeout)
+        return self._send_sync(command, timeout)
 
     def send_command_async(self, command: str, timeout: float = None) -> Future:
         """Send command asynchronously"""
@@ -261,14 +337,14 @@ class GRBLController(IGRBLConnection, IGRBLStatus, IGRBLMovement, IGRBLCommunica
             raise Exception("GRBL not connected")
         
         timeout = timeout or 5.0
-        return self._communicator.send_command_async(command, timeout)
+        return self._send_async(command, timeout)
 
     def send_realtime_command(self, command: str) -> None:
         """Send realtime command"""
         if not self.is_connected():
             raise Exception("GRBL not connected")
         
-        self._communicator.send_realtime_command(command)
+        self._send_rt(command)
 
     # Additional methods for compatibility - REMOVED old logging methods
     # Logging now handled by @log_aware decorator
@@ -291,6 +367,9 @@ class GRBLController(IGRBLConnection, IGRBLStatus, IGRBLMovement, IGRBLCommunica
         
         self.current_position = status_data.get('machine_position', self.current_position)
         self.current_status = status_data['state']
+        self._status_stamp_ns = time.monotonic_ns()
+        if self.current_status in self.SETTLED_STATES:
+            self._idle_event.set()
         
         # Emit events if changed
         if old_position != self.current_position:
@@ -303,7 +382,7 @@ class GRBLController(IGRBLConnection, IGRBLStatus, IGRBLMovement, IGRBLCommunica
         """Query and update current work coordinate offsets"""
         try:
             # Query work coordinate system offsets - fast timeout
-            response = self._communicator.send_command_sync("$#", timeout=1.0)
+            response = self._send_sync("$#", timeout=1.0)
             
             self.debug(f"Work offset query response: {len(response)} lines")
             
@@ -340,6 +419,7 @@ class GRBLController(IGRBLConnection, IGRBLStatus, IGRBLMovement, IGRBLCommunica
     def _cleanup_connection(self) -> None:
         """Clean up connection resources"""
         self._is_connected = False
+        self._status_stamp_ns = 0
         self._communicator.stop()
         self._serial.close()
         self.current_position = [0.0, 0.0, 0.0]
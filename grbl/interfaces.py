@@ -5,6 +5,8 @@ from typing import List
 
 
 class IGRBLConnection(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def connect(self, port: str, baudrate: int = 115200) -> bool: pass
 
@@ -16,6 +18,8 @@ class IGRBLConnection(ABC):
 
 
 class IGRBLMovement(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def home(self) -> bool: pass
 
@@ -36,6 +40,8 @@ class IGRBLMovement(ABC):
 
 
 class IGRBLStatus(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def get_position(self) -> List[float]: pass
 
@@ -44,6 +50,8 @@ class IGRBLStatus(ABC):
 
 
 class IGRBLCommunication(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def send_command(self, command: str, timeout: float = None) -> List[str]: pass
 
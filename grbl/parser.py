@@ -2,47 +2,78 @@
 GRBL Response Parser - Single Responsibility: Parse GRBL protocol messages
 """
 import re
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple, Union
 
 
 class GRBLResponseParser:
     """Parses GRBL protocol responses - no dependencies, pure function"""
     
-    # Flexible status pattern - handles various GRBL status formats
-    # Can have MPos, WPos, or both; supports 3 or 4 axes
-    STATUS_PATTERN = re.compile(r'\<([^|>]+)(?:\|([^>]+))?\>')
+    __slots__ = ()  # Stateless - no per-instance __dict__
+    
     POSITION_PATTERN = re.compile(r'([+-]?\d+\.?\d*)(?:,([+-]?\d+\.?\d*))*')
     ERROR_PATTERN = re.compile(r'error:(\d+)')
+    # One scan classifies a raw line: ok / error:<code> / <status frame>
+    LINE_PATTERN = re.compile(rb'(?i:(ok)|error:(\d*).*)|(<.*>)', re.DOTALL)
+    
+    # Line kinds returned by classify()
+    LINE_OK = 'ok'
+    LINE_ERROR = 'error'
+    LINE_STATUS = 'status'
+    LINE_OTHER = 'other'
+    
+    def classify(self, line: bytes) -> Tuple[str, object]:
+        """Classify a raw (stripped) line in one regex scan
+        
+        Returns (LINE_OK, None), (LINE_ERROR, code or None),
+        (LINE_STATUS, parsed status or None) or (LINE_OTHER, None).
+        """
+        match = self.LINE_PATTERN.fullmatch(line)
+        if match is None:
+            return self.LINE_OTHER, None
+        if match.group(1) is not None:
+            return self.LINE_OK, None
+        if match.group(3) is not None:
+            return self.LINE_STATUS, self.parse_status_response(line)
+        code = match.group(2)
+        return self.LINE_ERROR, code.decode('ascii') if code else None
     
-    def parse_status_response(self, response: str) -> Optional[Dict]:
+    def parse_status_response(self, response: Union[str, bytes]) -> Optional[Dict]:
         """Parse status response and extract position/state
         
         Handles multiple formats:
         - <Idle|WPos:x,y,z>
         - <Idle|MPos:x,y,z|WPos:x,y,z>
         - <Idle|WPos:x,y,z,a> (4-axis)
+        
+        Accepts raw bytes straight from the serial port as well as str.
         """
-        match = self.STATUS_PATTERN.search(response)
-        if not match:
+        raw = isinstance(response, bytes)
+        
+        # Single scan: locate the <...> frame, then split fields once
+        start = response.find(b'<' if raw else '<')
+        if start < 0:
+            return None
+        end = response.find(b'>' if raw else '>', start + 1)
+        if end < 0:
             return None
         
-        state = match.group(1).split('|')[0]  # Get state, ignore sub-states
-        fields_str = match.group(2) or match.group(1)  # Get fields after state
+        fields = response[start + 1:end].split(b'|' if raw else '|')
+        state = fields[0]  # Get state
+        if not state:
+            return None
+        if raw:
+            state = state.decode('ascii', errors='ignore')
         
         # Parse fields
         mpos = None
         wpos = None
+        mpos_tag, wpos_tag = (b'MPos:', b'WPos:') if raw else ('MPos:', 'WPos:')
         
-        # Split by pipe and parse each field
-        fields = response[1:-1].split('|')  # Remove < > and split
-        
-        for field in fields:
-            if field.startswith('MPos:'):
-                coords_str = field[5:]  # Remove "MPos:"
-                mpos = self._parse_coordinates(coords_str)
-            elif field.startswith('WPos:'):
-                coords_str = field[5:]  # Remove "WPos:"
-                wpos = self._parse_coordinates(coords_str)
+        for field in fields[1:]:
+            if field.startswith(mpos_tag):
+                mpos = self._parse_coordinates(field[5:])  # Remove "MPos:"
+            elif field.startswith(wpos_tag):
+                wpos = self._parse_coordinates(field[5:])  # Remove "WPos:"
         
         # Build result - use MPos if available, otherwise WPos
         result = {'state': state}
@@ -57,22 +88,29 @@ class GRBLResponseParser:
         
         return result if 'machine_position' in result else None
     
-    def _parse_coordinates(self, coords_str: str) -> Optional[List[float]]:
-        """Parse coordinate string to list of floats"""
+    def _parse_coordinates(self, coords_str: Union[str, bytes]) -> Optional[List[float]]:
+        """Parse coordinate string (or bytes) to list of floats"""
         try:
-            coords = [float(x.strip()) for x in coords_str.split(',')]
-            # Return first 3 coordinates (X, Y, Z) - ignore 4th axis for now
-            return coords[:3]
+            separator = b',' if isinstance(coords_str, bytes) else ','
+            # Return first 3 coordinates (X, Y, Z) - ignore 4th axis for now,
+            # so stop splitting early and never box floats that get dropped
+            # (float() tolerates surrounding whitespace, so map it directly)
+            return list(map(float, coords_str.split(separator, 3)[:3]))
         except (ValueError, AttributeError):
             return None
     
-    def is_ok_response(self, response: str) -> bool:
+    def is_ok_response(self, response: Union[str, bytes]) -> bool:
         """Check if response indicates success"""
-        return response.strip().lower() == 'ok'
+        # Exact match first - reader already strips lines, so no allocation
+        if isinstance(response, bytes):
+            return response == b'ok' or response.strip().lower() == b'ok'
+        return response == 'ok' or response.strip().lower() == 'ok'
     
-    def is_error_response(self, response: str) -> bool:
+    def is_error_response(self, response: Union[str, bytes]) -> bool:
         """Check if response indicates error"""
-        return response.strip().lower().startswith('error:')
+        if isinstance(response, bytes):
+            return response.startswith(b'error:') or response.strip().lower().startswith(b'error:')
+        return response.startswith('error:') or response.strip().lower().startswith('error:')
     
     def extract_error_code(self, response: str) -> Optional[str]:
         """Extract error code from error response"""
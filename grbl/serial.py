@@ -4,15 +4,19 @@ Serial Connection Implementation - Abstraction over pyserial
 import serial
 import threading
 import time
-from typing import Optional
+from typing import Iterable, List, Optional
 
 
 class SerialConnection:
     """Simple serial communication wrapper with thread safety"""
     
+    __slots__ = ('_connection', '_lock', '_rx_buffer', '_timeout')
+    
     def __init__(self):
         self._connection: Optional[serial.Serial] = None
         self._lock = threading.Lock()
+        self._rx_buffer = bytearray()  # Bytes read ahead of the next newline
+        self._timeout: Optional[float] = None  # Read timeout the port was opened with
     
     def open(self, port: str, baudrate: int, timeout: float = 1.0) -> bool:
         """Open serial connection"""
@@ -20,6 +24,8 @@ class SerialConnection:
             with self._lock:
                 if self._connection and self._connection.is_open:
                     self._connection.close()
+                self._rx_buffer.clear()
+                self._timeout = timeout
                 
                 self._connection = serial.Serial(
                     port=port,
@@ -30,10 +36,22 @@ class SerialConnection:
                     parity='N',
                     stopbits=1
                 )
+                self._enable_low_latency()
                 return self._connection.is_open
         except Exception:
             return False
     
+    def _enable_low_latency(self) -> None:
+        """Switch USB-serial adapters to their 1ms latency timer where supported"""
+        # pyserial only provides this on Linux (ASYNC_LOW_LATENCY via TIOCSSERIAL)
+        set_low_latency = getattr(self._connection, 'set_low_latency_mode', None)
+        if set_low_latency is None:
+            return
+        try:
+            set_low_latency(True)
+        except Exception:
+            pass  # Driver does not support it - keep default latency
+    
     def close(self) -> None:
         """Close serial connection"""
         with self._lock:
@@ -44,6 +62,7 @@ class SerialConnection:
                     pass
                 finally:
                     self._connection = None
+                    self._rx_buffer.clear()
     
     def is_open(self) -> bool:
         """Check if connection is open"""
@@ -57,35 +76,100 @@ class SerialConnection:
                 raise ConnectionError("Serial port not open")
             return self._connection.write(data)
     
-    def read_line(self, timeout: Optional[float] = None) -> Optional[str]:
-        """Read a line from serial port"""
+    def write_frames(self, frames: Iterable[bytes]) -> int:
+        """Write several frames with a single call to the serial port"""
+        # join sizes the buffer once and copies each frame in C
+        return self.write(b''.join(frames))
+    
+    def read_line_bytes(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """Read a raw line from serial port without decoding"""
         with self._lock:
             if not self._connection or not self._connection.is_open:
                 return None
             
+            old_timeout = self._connection.timeout
+            budget = timeout if timeout is not None else self._timeout
+            # One deadline for the whole line - a trickling device must not restart it per chunk
+            deadline = None if budget is None else time.monotonic() + budget
+            
+            try:
+                # Drain whatever is waiting in one read instead of byte-by-byte readline()
+                buffer = self._rx_buffer
+                newline = buffer.find(b'\n')
+                while newline < 0:
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return None  # Timed out - keep the partial line for the next call
+                        self._connection.timeout = remaining
+                    chunk = self._connection.read(self._connection.in_waiting or 1)
+                    if not chunk:
+                        return None  # Timed out - keep the partial line for the next call
+                    buffer += chunk
+                    newline = buffer.find(b'\n')
+                
+                line = bytes(buffer[:newline]).strip()
+                del buffer[:newline + 1]
+                return line
+            except:
+                return None
+            finally:
+                self._connection.timeout = old_timeout
+    
+    def read_lines_bytes(self, timeout: Optional[float] = None) -> List[bytes]:
+        """Read everything waiting and return all complete raw lines"""
+        with self._lock:
+            if not self._connection or not self._connection.is_open:
+                return []
+            
             old_timeout = self._connection.timeout
             if timeout is not None:
                 self._connection.timeout = timeout
             
             try:
-                line = self._connection.readline()
-                if line:
-                    return line.decode('utf-8', errors='ignore').strip()
-                return None
+                # Block for at most one byte, then drain the rest in a single read
+                buffer = self._rx_buffer
+                if buffer.find(b'\n') < 0:
+                    chunk = self._connection.read(self._connection.in_waiting or 1)
+                    if not chunk:
+                        return []
+                    buffer += chunk
+                    waiting = self._connection.in_waiting
+                    if waiting:
+                        buffer += self._connection.read(waiting)
+                
+                # Split frames in memory - the trailing partial line stays buffered
+                end = buffer.rfind(b'\n')
+                if end < 0:
+                    return []
+                lines = bytes(buffer[:end]).split(b'\n')
+                del buffer[:end + 1]
+                return [line.strip() for line in lines]
             except:
-                return None
+                return []
             finally:
                 self._connection.timeout = old_timeout
     
+    def read_line(self, timeout: Optional[float] = None) -> Optional[str]:
+        """Read a line from serial port"""
+        line = self.read_line_bytes(timeout)
+        if line is None:
+            return None
+        return line.decode('utf-8', errors='ignore')
+    
     def reset_input_buffer(self) -> None:
         """Clear input buffer"""
         with self._lock:
+            self._rx_buffer.clear()
             if self._connection and self._connection.is_open:
                 self._connection.reset_input_buffer()
     
     def in_waiting(self) -> int:
-        """Number of bytes waiting to be read"""
+        """Number of bytes waiting to be read, including read-ahead complete lines"""
         with self._lock:
             if self._connection and self._connection.is_open:
-                return self._connection.in_waiting
+                # A partial line is not readable yet - counting it would keep the
+                # reader blocking in reads and starve its timeout checks
+                buffered = len(self._rx_buffer) if b'\n' in self._rx_buffer else 0
+                return buffered + self._connection.in_waiting
             return 0
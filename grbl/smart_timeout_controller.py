@@ -12,6 +12,8 @@ from .controller import GRBLController, GRBLEvents
 from .interfaces import IGRBLConnection, IGRBLStatus, IGRBLMovement, IGRBLCommunication
 from .timeout import TimeoutCalculator
 
+_ZERO_POSITION = (0.0, 0.0, 0.0, 0.0)
+
 
 @event_aware()
 @log_aware("SmartTimeout")
@@ -62,44 +64,44 @@ class SmartTimeoutController(IGRBLConnection, IGRBLStatus, IGRBLMovement, IGRBLC
     def home(self) -> bool:
         timeout = self._timeout_calc.calculate_timeout("$H", self._get_current_position_4axis())
         self.debug(f"Homing with calculated timeout: {timeout:.1f}s")
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         try:
             result = self._execute_with_timeout("$H", timeout)
-            self._record_execution("$H", timeout, time.time() - start_time)
+            self._record_execution("$H", timeout, (time.monotonic_ns() - start_ns) * 1e-9)
             return result
         except Exception as e:
-            self._record_execution("$H", timeout, time.time() - start_time)
+            self._record_execution("$H", timeout, (time.monotonic_ns() - start_ns) * 1e-9)
             raise
     
     @logged(LogLevel.INFO)
     def move_to(self, x: float, y: float, z: float, feed_rate: float = None) -> bool:
         if feed_rate:
-            command = f"G0 X{x:.3f} Y{y:.3f} Z{z:.3f} F{feed_rate}"
+            command = GRBLController.MOVE_FEED_FORMAT(x, y, z, feed_rate)
         else:
-            command = f"G0 X{x:.3f} Y{y:.3f} Z{z:.3f}"
+            command = GRBLController.MOVE_FORMAT(x, y, z)
         timeout = self._timeout_calc.calculate_timeout(command, self._get_current_position_4axis())
         self.debug(f"Move to ({x:.1f}, {y:.1f}, {z:.1f}) with timeout: {timeout:.1f}s")
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         try:
             result = self._execute_with_timeout(command, timeout)
-            self._record_execution(command, timeout, time.time() - start_time)
+            self._record_execution(command, timeout, (time.monotonic_ns() - start_ns) * 1e-9)
             return result
         except Exception as e:
-            self._record_execution(command, timeout, time.time() - start_time)
+            self._record_execution(command, timeout, (time.monotonic_ns() - start_ns) * 1e-9)
             raise
     
     @logged(LogLevel.INFO)
     def jog_relative(self, x: float = 0, y: float = 0, z: float = 0, feed_rate: float = 1000) -> bool:
-        command = f"$J=G91 X{x:.3f} Y{y:.3f} Z{z:.3f} F{feed_rate}"
+        command = GRBLController.JOG_FORMAT(x, y, z, feed_rate)
         timeout = self._timeout_calc.calculate_timeout(command, self._get_current_position_4axis())
         self.debug(f"Jog relative ({x:.1f}, {y:.1f}, {z:.1f}) with timeout: {timeout:.1f}s")
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         try:
             result = self._execute_with_timeout(command, timeout)
-            self._record_execution(command, timeout, time.time() - start_time)
+            self._record_execution(command, timeout, (time.monotonic_ns() - start_ns) * 1e-9)
             return result
         except Exception as e:
-            self._record_execution(command, timeout, time.time() - start_time)
+            self._record_execution(command, timeout, (time.monotonic_ns() - start_ns) * 1e-9)
             raise
     
     def emergency_stop(self) -> bool:
@@ -116,16 +118,18 @@ class SmartTimeoutController(IGRBLConnection, IGRBLStatus, IGRBLMovement, IGRBLC
     
     @logged(LogLevel.DEBUG, log_args=True)
     def send_command(self, command: str, timeout: float = None) -> List[str]:
-        if timeout is None:
-            timeout = self._timeout_calc.calculate_timeout(command, self._get_current_position_4axis())
-            self.debug(f"Calculated timeout for '{command}': {timeout:.1f}s")
-        start_time = time.time()
+        if timeout is not None:
+            # Caller chose the timeout - nothing was predicted, so nothing to record
+            return self._controller.send_command(command, timeout)
+        timeout = self._timeout_calc.calculate_timeout(command, self._get_current_position_4axis())
+        self.debug(f"Calculated timeout for '{command}': {timeout:.1f}s")
+        start_ns = time.monotonic_ns()
         try:
             result = self._controller.send_command(command, timeout)
-            self._record_execution(command, timeout, time.time() - start_time)
+            self._record_execution(command, timeout, (time.monotonic_ns() - start_ns) * 1e-9)
             return result
         except Exception as e:
-            self._record_execution(command, timeout, time.time() - start_time)
+            self._record_execution(command, timeout, (time.monotonic_ns() - start_ns) * 1e-9)
             raise
     
     @logged(LogLevel.DEBUG, log_args=True)
@@ -142,17 +146,18 @@ class SmartTimeoutController(IGRBLConnection, IGRBLStatus, IGRBLMovement, IGRBLC
         return self._timeout_calc.get_statistics()
     
     def reset_timeout_statistics(self) -> None:
-        self._timeout_calc.timeout_history.clear()
+        self._timeout_calc.reset_history()
         self.info("Timeout statistics reset")
     
     def _get_current_position_4axis(self) -> tuple:
         pos = self._controller.current_position
-        if len(pos) == 3:
+        n = len(pos)
+        # Most common shape first - controllers report XYZ
+        if n == 3:
             return (pos[0], pos[1], pos[2], 0.0)
-        elif len(pos) == 4:
-            return tuple(pos)
-        else:
-            return (0.0, 0.0, 0.0, 0.0)
+        if n == 4:
+            return (pos[0], pos[1], pos[2], pos[3])
+        return _ZERO_POSITION
     
     def _execute_with_timeout(self, command: str, timeout: float) -> bool:
         response = self._controller.send_command(command, timeout)
@@ -165,4 +170,6 @@ class SmartTimeoutController(IGRBLConnection, IGRBLStatus, IGRBLMovement, IGRBLC
             self.debug(f"Failed to record execution time: {e}")
     
     def __getattr__(self, name):
+        # Only reached after normal lookup misses - never cached, so patched or
+        # reassigned attributes on the wrapped controller are always seen
         return getattr(self._controller, name)
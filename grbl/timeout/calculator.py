@@ -1,10 +1,11 @@
 """
 Timeout Calculator Service - Smart timeout calculation for GRBL commands
 """
-from typing import List, Tuple, Optional
+from collections import deque
+from typing import Dict, List, Tuple, Optional
 from core.logger import log_aware, logged, LogLevel
 from ..config import GRBLMachineConfig, GRBLConfigParser
-from .command_analyzer import CommandAnalyzer
+from .command_analyzer import CommandAnalyzer, CommandType
 from .movement_calculator import MovementCalculator, SafetyMarginProvider
 
 
@@ -12,23 +13,71 @@ from .movement_calculator import MovementCalculator, SafetyMarginProvider
 class TimeoutCalculator:
     """Calculates smart timeouts based on command analysis and machine configuration"""
     
+    TIMEOUT_CACHE_SIZE = 1024  # Distinct (command, position) pairs kept before the cache resets
+    ACCURACY_EWMA_ALPHA = 0.2  # Weight of the newest sample in the running accuracy
+    
+    # Commands whose timeout never depends on position or config - skip parsing entirely
+    FIXED_COMMANDS = {
+        '?': CommandType.STATUS_QUERY,
+        '$$': CommandType.SETTINGS,
+        '$#': CommandType.PARAMETERS,
+        '!': CommandType.REALTIME,
+        '~': CommandType.REALTIME,
+        chr(0x18): CommandType.REALTIME,
+    }
+    
     def __init__(self, machine_config: Optional[GRBLMachineConfig] = None):
-        self.config = machine_config or GRBLMachineConfig()
+        self._config = machine_config or GRBLMachineConfig()
         self.config_parser = GRBLConfigParser()
         self.command_analyzer = CommandAnalyzer()
-        self.movement_calculator = MovementCalculator(self.config)
+        self.movement_calculator = MovementCalculator(self._config)
         self.safety_provider = SafetyMarginProvider()
         
+        # Memoized timeouts - keyed on the safety settings too, cleared when the config changes
+        self._timeout_cache: Dict[Tuple, float] = {}
+        
         # Adaptive learning
-        self.timeout_history = []
         self.max_history = 100
+        self.timeout_history = deque(maxlen=self.max_history)  # Oldest entry drops on append
+        self._accuracy_ewma: Optional[float] = None  # Running actual/predicted ratio
         
         self.debug(f"Initialized with config: max_rates=({self.config.max_rate_x}, {self.config.max_rate_y}, {self.config.max_rate_z}, {self.config.max_rate_a})")
     
+    @property
+    def config(self) -> GRBLMachineConfig:
+        return self._config
+    
+    @config.setter
+    def config(self, machine_config: GRBLMachineConfig) -> None:
+        self._config = machine_config
+        self.movement_calculator.config = machine_config
+        self._timeout_cache.clear()
+    
+    def invalidate_cache(self) -> None:
+        """Drop memoized timeouts - call after mutating config fields in place"""
+        self.movement_calculator.invalidate_cache()
+        self._timeout_cache.clear()
+    
     @logged(LogLevel.DEBUG, log_args=True, log_result=True)
     def calculate_timeout(self, command: str, current_position: Tuple[float, float, float, float] = (0, 0, 0, 0)) -> float:
         """Calculate optimal timeout for a GRBL command (4-axis support)"""
-        
+        fixed_type = self.FIXED_COMMANDS.get(command.strip())
+        if fixed_type is not None:
+            return self.safety_provider.get_fixed_timeout(fixed_type)
+        
+        # Safety settings are public and may be tuned directly - a change must miss the cache
+        safety = self.safety_provider
+        position = tuple(current_position)
+        key = (command, position, safety.base_safety_factor, safety.minimum_timeout, safety.maximum_timeout)
+        timeout = self._timeout_cache.get(key)
+        if timeout is None:
+            if len(self._timeout_cache) >= self.TIMEOUT_CACHE_SIZE:
+                self._timeout_cache.clear()
+            timeout = self._timeout_cache[key] = self._compute_timeout(command, position)
+        return timeout
+    
+    def _compute_timeout(self, command: str, current_position: Tuple[float, ...]) -> float:
+        """Parse, time and pad a command - the uncached path of calculate_timeout"""
         # Parse the command
         parsed_cmd = self.command_analyzer.parse_command(command, current_position)
         
@@ -51,8 +100,7 @@ class TimeoutCalculator:
         """Update machine configuration from GRBL $$ response"""
         try:
             new_config = self.config_parser.parse_settings(settings_response)
-            self.config = new_config
-            self.movement_calculator = MovementCalculator(self.config)
+            self.config = new_config  # Setter refreshes the movement calculator and cache
             
             self.info(f"Updated machine config from GRBL settings")
             self.debug(f"New max rates: X={self.config.max_rate_x}, Y={self.config.max_rate_y}, Z={self.config.max_rate_z}, A={self.config.max_rate_a}")
@@ -62,29 +110,37 @@ class TimeoutCalculator:
     
     def record_execution_time(self, command: str, predicted_time: float, actual_time: float) -> None:
         """Record actual execution time for adaptive learning"""
+        accuracy = actual_time / predicted_time if predicted_time > 0 else 1.0
         self.timeout_history.append({
             'command': command,
             'predicted': predicted_time,
             'actual': actual_time,
-            'accuracy': actual_time / predicted_time if predicted_time > 0 else 1.0
+            'accuracy': accuracy
         })
         
-        # Limit history size
-        if len(self.timeout_history) > self.max_history:
-            self.timeout_history.pop(0)
+        # EWMA - O(1) per sample, recent commands weigh most
+        ewma = self._accuracy_ewma
+        alpha = self.ACCURACY_EWMA_ALPHA
+        self._accuracy_ewma = accuracy if ewma is None else alpha * accuracy + (1 - alpha) * ewma
         
         # Adaptive adjustment
         if len(self.timeout_history) >= 10:
-            recent_accuracy = [h['accuracy'] for h in self.timeout_history[-10:]]
-            avg_accuracy = sum(recent_accuracy) / len(recent_accuracy)
+            avg_accuracy = self._accuracy_ewma
             
             if avg_accuracy > 1.2:  # Consistently over-predicting
                 self.safety_provider.base_safety_factor *= 0.95
+                self._timeout_cache.clear()
                 self.debug(f"Reduced safety factor to {self.safety_provider.base_safety_factor:.2f}")
             elif avg_accuracy < 0.8:  # Consistently under-predicting
                 self.safety_provider.base_safety_factor *= 1.05
+                self._timeout_cache.clear()
                 self.debug(f"Increased safety factor to {self.safety_provider.base_safety_factor:.2f}")
     
+    def reset_history(self) -> None:
+        """Forget recorded executions and the running accuracy"""
+        self.timeout_history.clear()
+        self._accuracy_ewma = None
+    
     def get_statistics(self) -> dict:
         """Get timeout calculation statistics"""
         if not self.timeout_history:
@@ -93,10 +149,11 @@ class TimeoutCalculator:
         accuracies = [h['accuracy'] for h in self.timeout_history]
         
         return {
-            'total_commands': len(self.timeout_history),
+            'total_commands': len(accuracies),
             'avg_accuracy': sum(accuracies) / len(accuracies),
             'min_accuracy': min(accuracies),
             'max_accuracy': max(accuracies),
+            'accuracy_ewma': self._accuracy_ewma,
             'current_safety_factor': self.safety_provider.base_safety_factor
         }
 
@@ -142,14 +199,14 @@ class TimeoutCalculatorService:
         
         # Track execution time for learning
         import time
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         try:
             result = self._grbl.send_command(command, timeout)
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_ns) * 1e-9
             self._timeout_calc.record_execution_time(command, timeout, execution_time)
             return result
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_ns) * 1e-9
             self._timeout_calc.record_execution_time(command, timeout, execution_time)
             raise
     
@@ -8,6 +8,12 @@ from dataclasses import dataclass
 from enum import Enum
 
 
+# Single tokenizer for every G-code word the analyzer cares about (commands are upper-cased first)
+_WORD_PATTERN = re.compile(r'([XYZAIJRF])([-+]?\d*\.?\d+)')
+_AXIS_INDEX = {'X': 0, 'Y': 1, 'Z': 2, 'A': 3}
+_ARC_CENTER_INDEX = {'I': 0, 'J': 1}
+
+
 class CommandType(Enum):
     """Types of GRBL commands"""
     RAPID_MOVE = "G0"           # Rapid positioning
@@ -37,13 +43,6 @@ class ParsedCommand:
 class CommandAnalyzer:
     """Analyzes GRBL commands to extract movement and timing parameters"""
     
-    def __init__(self):
-        # Regex patterns for command parsing (updated for 4-axis)
-        self.position_pattern = re.compile(r'([XYZA])([-+]?\d*\.?\d+)', re.IGNORECASE)
-        self.feed_pattern = re.compile(r'F([-+]?\d*\.?\d+)', re.IGNORECASE)
-        self.arc_center_pattern = re.compile(r'([IJ])([-+]?\d*\.?\d+)', re.IGNORECASE)
-        self.arc_radius_pattern = re.compile(r'R([-+]?\d*\.?\d+)', re.IGNORECASE)
-    
     def parse_command(self, command: str, current_position: Tuple[float, float, float, float] = (0, 0, 0, 0)) -> ParsedCommand:
         """Parse a GRBL command into structured data"""
         command = command.strip().upper()
@@ -95,29 +94,31 @@ class CommandAnalyzer:
             raw_command=command
         )
     
-    def _parse_movement_command(self, command: str, cmd_type: CommandType, current_pos: Tuple[float, float, float, float]) -> ParsedCommand:
-        """Parse linear movement commands (G0, G1) with 4-axis support"""
+    def _scan_words(self, command: str, current_pos: Tuple[float, float, float, float]):
+        """Tokenize a command once - returns (target_pos, arc_center, arc_radius, feed_rate)"""
         target_pos = list(current_pos)
+        arc_center = [0.0, 0.0]
+        arc_radius = None
         feed_rate = None
         
-        # Extract position coordinates for all 4 axes
-        for match in self.position_pattern.finditer(command):
-            axis = match.group(1).upper()
-            value = float(match.group(2))
-            
-            if axis == 'X':
-                target_pos[0] = value
-            elif axis == 'Y':
-                target_pos[1] = value
-            elif axis == 'Z':
-                target_pos[2] = value
-            elif axis == 'A':
-                target_pos[3] = value
-        
-        # Extract feed rate
-        feed_match = self.feed_pattern.search(command)
-        if feed_match:
-            feed_rate = float(feed_match.group(1))
+        for letter, text in _WORD_PATTERN.findall(command):
+            axis = _AXIS_INDEX.get(letter)
+            if axis is not None:
+                target_pos[axis] = float(text)  # Last word for an axis wins
+            elif letter == 'F':
+                if feed_rate is None:
+                    feed_rate = float(text)  # First F word wins
+            elif letter == 'R':
+                if arc_radius is None:
+                    arc_radius = float(text)
+            else:
+                arc_center[_ARC_CENTER_INDEX[letter]] = float(text)
+        
+        return target_pos, arc_center, arc_radius, feed_rate
+    
+    def _parse_movement_command(self, command: str, cmd_type: CommandType, current_pos: Tuple[float, float, float, float]) -> ParsedCommand:
+        """Parse linear movement commands (G0, G1) with 4-axis support"""
+        target_pos, _, _, feed_rate = self._scan_words(command, current_pos)
         
         return ParsedCommand(
             command_type=cmd_type,
@@ -128,44 +129,7 @@ class CommandAnalyzer:
     
     def _parse_arc_command(self, command: str, is_clockwise: bool, current_pos: Tuple[float, float, float, float]) -> ParsedCommand:
         """Parse circular movement commands (G2, G3) with 4-axis support"""
-        target_pos = list(current_pos)
-        arc_center = [0.0, 0.0]
-        arc_radius = None
-        feed_rate = None
-        
-        # Extract target position (including A-axis)
-        for match in self.position_pattern.finditer(command):
-            axis = match.group(1).upper()
-            value = float(match.group(2))
-            
-            if axis == 'X':
-                target_pos[0] = value
-            elif axis == 'Y':
-                target_pos[1] = value
-            elif axis == 'Z':
-                target_pos[2] = value
-            elif axis == 'A':
-                target_pos[3] = value
-        
-        # Extract arc center (I, J parameters)
-        for match in self.arc_center_pattern.finditer(command):
-            axis = match.group(1).upper()
-            value = float(match.group(2))
-            
-            if axis == 'I':
-                arc_center[0] = value
-            elif axis == 'J':
-                arc_center[1] = value
-        
-        # Extract arc radius (R parameter)
-        radius_match = self.arc_radius_pattern.search(command)
-        if radius_match:
-            arc_radius = float(radius_match.group(1))
-        
-        # Extract feed rate
-        feed_match = self.feed_pattern.search(command)
-        if feed_match:
-            feed_rate = float(feed_match.group(1))
+        target_pos, arc_center, arc_radius, feed_rate = self._scan_words(command, current_pos)
         
         return ParsedCommand(
             command_type=CommandType.CIRCULAR_MOVE,
@@ -181,11 +145,11 @@ class CommandAnalyzer:
                             end_pos: Tuple[float, float, float, float], 
                             has_rotary_a: bool = True) -> float:
         """Calculate distance for 4-axis movement (linear + rotary)"""
-        # Linear distance (X, Y, Z)
-        linear_distance = math.sqrt(
-            (end_pos[0] - start_pos[0])**2 +
-            (end_pos[1] - start_pos[1])**2 +
-            (end_pos[2] - start_pos[2])**2
+        # Linear distance (X, Y, Z) - hypot does the sum of squares in C
+        linear_distance = math.hypot(
+            end_pos[0] - start_pos[0],
+            end_pos[1] - start_pos[1],
+            end_pos[2] - start_pos[2]
         )
         
         # A-axis distance
@@ -203,10 +167,10 @@ class CommandAnalyzer:
     
     def calculate_distance(self, start_pos: Tuple[float, float, float], end_pos: Tuple[float, float, float]) -> float:
         """Calculate Euclidean distance between two 3D points (legacy method)"""
-        return math.sqrt(
-            (end_pos[0] - start_pos[0])**2 +
-            (end_pos[1] - start_pos[1])**2 +
-            (end_pos[2] - start_pos[2])**2
+        return math.hypot(
+            end_pos[0] - start_pos[0],
+            end_pos[1] - start_pos[1],
+            end_pos[2] - start_pos[2]
         )
     
     def calculate_arc_length(self, start_pos: Tuple[float, float, float], end_pos: Tuple[float, float, float], 
@@ -13,6 +13,22 @@ class MovementCalculator:
     def __init__(self, machine_config: GRBLMachineConfig):
         self.config = machine_config
     
+    @property
+    def config(self) -> GRBLMachineConfig:
+        return self._config
+    
+    @config.setter
+    def config(self, machine_config: GRBLMachineConfig) -> None:
+        # Assigning a config always refreshes the derived values
+        self._config = machine_config
+        self.invalidate_cache()
+    
+    def invalidate_cache(self) -> None:
+        """Recompute config-derived values - call after mutating config fields in place"""
+        self._homing_time = self._compute_homing_time()
+        self._rapid_feed_rate = min(self.config.max_rate_x, self.config.max_rate_y,
+                                    self.config.max_rate_z, self.config.max_rate_a)
+    
     def calculate_movement_time(self, parsed_cmd: ParsedCommand, current_position: Tuple[float, float, float, float]) -> float:
         """Calculate total movement time for a parsed command (4-axis)"""
         
@@ -44,9 +60,7 @@ class MovementCalculator:
         # Determine feed rate
         if parsed_cmd.command_type == CommandType.RAPID_MOVE:
             # Use maximum machine rate for rapid moves
-            max_rates = [self.config.max_rate_x, self.config.max_rate_y, 
-                        self.config.max_rate_z, self.config.max_rate_a]
-            feed_rate = min(max_rates)
+            feed_rate = self._rapid_feed_rate
         else:
             # Use commanded feed rate or default
             feed_rate = parsed_cmd.feed_rate or self.config.default_feed_rate
@@ -151,6 +165,10 @@ class MovementCalculator:
     
     def _calculate_homing_time(self) -> float:
         """Calculate time for homing cycle (4-axis)"""
+        return self._homing_time
+    
+    def _compute_homing_time(self) -> float:
+        """Compute homing cycle time from machine config (4-axis)"""
         max_travels = [self.config.max_travel_x, self.config.max_travel_y, 
                       self.config.max_travel_z, self.config.max_travel_a]
         max_travel = max(max_travels)
@@ -170,21 +188,13 @@ class MovementCalculator:
     
     def _calculate_trapezoidal_profile(self, distance: float, max_velocity: float, acceleration: float) -> float:
         """Calculate time using trapezoidal velocity profile"""
-        
-        # Time to reach max velocity
-        accel_time = max_velocity / acceleration
-        accel_distance = 0.5 * acceleration * accel_time**2
-        
-        # Check if we can reach max velocity
-        if 2 * accel_distance >= distance:
-            # Triangular profile (never reach max velocity)
-            accel_time = math.sqrt(distance / acceleration)
-            return 2 * accel_time  # Accelerate + decelerate
-        else:
-            # Trapezoidal profile
-            const_velocity_distance = distance - 2 * accel_distance
-            const_velocity_time = const_velocity_distance / max_velocity
-            return 2 * accel_time + const_velocity_time
+        # Reaching max velocity takes v/a seconds over v²/2a, so both ramps
+        # fit only when v² < distance * a
+        if max_velocity * max_velocity >= distance * acceleration:
+            # Triangular profile (never reach max velocity): accelerate + decelerate
+            return 2.0 * math.sqrt(distance / acceleration)
+        # Trapezoidal profile: 2v/a of ramps plus (d - v²/a)/v cruising
+        return max_velocity / acceleration + distance / max_velocity
     
     def _euclidean_distance_3d(self, pos1: Tuple[float, float, float], pos2: Tuple[float, float, float]) -> float:
         """Calculate 3D Euclidean distance (X, Y, Z only)"""
@@ -202,6 +212,14 @@ class MovementCalculator:
 class SafetyMarginProvider:
     """Provides safety margins for timeout calculations"""
     
+    # Fixed timeouts for non-movement commands
+    FIXED_TIMEOUTS = {
+        CommandType.STATUS_QUERY: 2.0,
+        CommandType.SETTINGS: 5.0,
+        CommandType.PARAMETERS: 3.0,
+        CommandType.REALTIME: 1.0,
+    }
+    
     def __init__(self):
         self.base_safety_factor = 2.0
         self.minimum_timeout = 1.0
@@ -238,11 +256,4 @@ class SafetyMarginProvider:
     
     def get_fixed_timeout(self, command_type: CommandType) -> Optional[float]:
         """Get fixed timeout for non-movement commands"""
-        fixed_timeouts = {
-            CommandType.STATUS_QUERY: 2.0,
-            CommandType.SETTINGS: 5.0,
-            CommandType.PARAMETERS: 3.0,
-            CommandType.REALTIME: 1.0,
-        }
-        
-        return fixed_timeouts.get(command_type)
+        return self.FIXED_TIMEOUTS.get(command_type)
@@ -0,0 +1,56 @@
+"""
+Shared pytest configuration
+Test modules stay independent so the suite can run in parallel:
+
+    pytest -n auto --dist loadgroup
+
+Modules under tests/hardware are marked "hardware" unless they set
+REQUIRES_HARDWARE = False (pure file/NumPy tests that shard freely).
+Hardware tests declare HW_GROUP ("cnc", "camera") on the class or module;
+each group is pinned to one xdist worker so a device is never opened twice,
+while different groups run concurrently. Set CNC_SKIP_PROMPT=1 to skip the
+manual confirmation prompt in non-interactive runs.
+"""
+import os
+import sys
+
+import pytest
+
+# Make project packages importable once - unit modules only insert it themselves
+# when run directly as scripts
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+HARDWARE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hardware')
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "hardware: needs a CNC machine or camera (deselect with -m 'not hardware')"
+    )
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run on the same xdist worker under --dist loadgroup"
+    )
+
+
+@pytest.fixture(scope="module")
+def camera(request):
+    """One camera connection per module, opened by the module's own _open_camera()
+
+    Lives here so hardware modules stay runnable as plain scripts without pytest.
+    """
+    camera = request.module._open_camera()
+    yield camera
+    camera.disconnect()
+
+
+def pytest_collection_modifyitems(config, items):
+    """Mark hardware tests and pin each device group (HW_GROUP) to one worker"""
+    for item in items:
+        if str(item.path).startswith(HARDWARE_DIR):
+            if getattr(item.module, 'REQUIRES_HARDWARE', True):
+                item.add_marker(pytest.mark.hardware)
+            group = getattr(item.cls, 'HW_GROUP', None) or getattr(item.module, 'HW_GROUP', None)
+            if group:
+                item.add_marker(pytest.mark.xdist_group(group))
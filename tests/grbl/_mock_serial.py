@@ -0,0 +1,11 @@
+"""
+Shared pyserial stub for GRBL unit tests - import before any grbl module
+"""
+import sys
+from unittest.mock import MagicMock
+
+# One mock tree; setdefault keeps repeated imports (and a real pyserial) intact
+_serial_mock = MagicMock()
+sys.modules.setdefault('serial', _serial_mock)
+sys.modules.setdefault('serial.tools', _serial_mock.tools)
+sys.modules.setdefault('serial.tools.list_ports', _serial_mock.tools.list_ports)
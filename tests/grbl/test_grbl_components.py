@@ -1,56 +1,118 @@
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 import sys
 import os
+import time
+import weakref
+from types import SimpleNamespace
+from contextlib import contextmanager
 
-# Add project root to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..','..')))
+# Direct runs only - under pytest tests/conftest.py puts the project root on sys.path
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
 # Mock external dependencies BEFORE importing
-sys.modules['serial'] = MagicMock()
-sys.modules['serial.tools'] = MagicMock()
-sys.modules['serial.tools.list_ports'] = MagicMock()
+from tests.grbl import _mock_serial  # noqa: F401
 
 from grbl.parser import GRBLResponseParser
 from grbl.serial import SerialConnection
 from grbl.controller import GRBLController
 
 
+@contextmanager
+def _stub(obj, name, fn=None):
+    """Swap an attribute for a Mock - plain setattr, cheaper than patch.object"""
+    fn = fn if fn is not None else Mock()
+    old = getattr(obj, name)
+    setattr(obj, name, fn)
+    try:
+        yield fn
+    finally:
+        setattr(obj, name, old)
+
+
+def _make_fake_serial():
+    """Lightweight SerialConnection double - avoids Mock(spec=...) introspection"""
+    return SimpleNamespace(
+        open=Mock(), close=Mock(), is_open=Mock(), write=Mock(),
+        read_line=Mock(), read_line_bytes=Mock(), read_lines_bytes=Mock(),
+        reset_input_buffer=Mock(), in_waiting=Mock(),
+    )
+
+
+def _make_fake_parser():
+    """Lightweight GRBLResponseParser double"""
+    return SimpleNamespace(
+        parse_status_response=Mock(), is_ok_response=Mock(), is_error_response=Mock(),
+        extract_error_code=Mock(), is_grbl_startup=Mock(), is_async_message=Mock(),
+        classify=Mock(),
+    )
+
+
 class TestGRBLResponseParser(unittest.TestCase):
     
-    def setUp(self):
-        self.parser = GRBLResponseParser()
-    
-    def test_parse_valid_status_response(self):
-        """Test parsing valid status response"""
-        response = "<Idle|MPos:0.000,0.000,0.000|WPos:0.000,0.000,0.000>"
-        result = self.parser.parse_status_response(response)
-        
-        self.assertIsNotNone(result)
-        self.assertEqual(result['state'], 'Idle')
-        self.assertEqual(result['machine_position'], [0.0, 0.0, 0.0])
-        self.assertEqual(result['work_position'], [0.0, 0.0, 0.0])
-    
-    def test_parse_status_with_coordinates(self):
-        """Test parsing status with actual coordinates"""
-        response = "<Run|MPos:10.500,-25.000,5.250|WPos:8.500,-23.000,3.250>"
-        result = self.parser.parse_status_response(response)
-        
-        self.assertIsNotNone(result)
-        self.assertEqual(result['state'], 'Run')
-        self.assertEqual(result['machine_position'], [10.5, -25.0, 5.25])
-        self.assertEqual(result['work_position'], [8.5, -23.0, 3.25])
-    
+    @classmethod
+    def setUpClass(cls):
+        # Parser is stateless - share one instance across the class
+        cls.parser = GRBLResponseParser()
+    
+    # (response, state, machine_position, work_position) - str and raw bytes frames
+    STATUS_CASES = (
+        ("<Idle|MPos:0.000,0.000,0.000|WPos:0.000,0.000,0.000>",
+         'Idle', [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]),
+        ("<Run|MPos:10.500,-25.000,5.250|WPos:8.500,-23.000,3.250>",
+         'Run', [10.5, -25.0, 5.25], [8.5, -23.0, 3.25]),
+        # WPos-only with trailing report fields - WPos doubles as machine position
+        ("<Idle|WPos:1.000,2.000,3.000|FS:0,0|WCO:0.000,0.000,0.000>",
+         'Idle', [1.0, 2.0, 3.0], [1.0, 2.0, 3.0]),
+        (b"<Jog|MPos:1.500,-2.000,3.250|WPos:0.500,-1.000,2.250>",
+         'Jog', [1.5, -2.0, 3.25], [0.5, -1.0, 2.25]),
+    )
+    
+    def test_parse_status_table(self):
+        """Test parsing status frames - one subtest per case"""
+        for response, state, machine_position, work_position in self.STATUS_CASES:
+            with self.subTest(response=response):
+                result = self.parser.parse_status_response(response)
+                
+                self.assertIsNotNone(result)
+                self.assertEqual(result['state'], state)
+                self.assertEqual(result['machine_position'], machine_position)
+                self.assertEqual(result['work_position'], work_position)
+
+    def test_parse_malformed_status_response(self):
+        """Test that unterminated or position-less frames are rejected"""
+        self.assertIsNone(self.parser.parse_status_response("<Idle|MPos:0.000,0.000"))
+        self.assertIsNone(self.parser.parse_status_response("<Idle|FS:0,0>"))
+        self.assertIsNone(self.parser.parse_status_response("ok"))
+
     def test_is_ok_response(self):
         """Test OK response detection"""
         self.assertTrue(self.parser.is_ok_response("ok"))
         self.assertTrue(self.parser.is_ok_response("OK"))
         self.assertFalse(self.parser.is_error_response("ok"))
+        self.assertTrue(self.parser.is_ok_response(b"ok"))
+        self.assertTrue(self.parser.is_ok_response(b"OK"))
+        self.assertFalse(self.parser.is_ok_response(b"error:1"))
     
     def test_is_error_response(self):
         """Test error response detection"""
         self.assertTrue(self.parser.is_error_response("error:1"))
+        self.assertTrue(self.parser.is_error_response(b"error:1"))
+        self.assertFalse(self.parser.is_error_response(b"ok"))
         self.assertEqual(self.parser.extract_error_code("error:25"), "25")
+    
+    def test_classify_line(self):
+        """Test single-scan classification of raw lines"""
+        parser = self.parser
+        self.assertEqual(parser.classify(b"ok"), (parser.LINE_OK, None))
+        self.assertEqual(parser.classify(b"OK"), (parser.LINE_OK, None))
+        self.assertEqual(parser.classify(b"error:25"), (parser.LINE_ERROR, "25"))
+        self.assertEqual(parser.classify(b"[MSG:Caution: Unlocked]"), (parser.LINE_OTHER, None))
+        
+        kind, status = parser.classify(b"<Idle|MPos:1.000,2.000,3.000>")
+        self.assertEqual(kind, parser.LINE_STATUS)
+        self.assertEqual(status['machine_position'], [1.0, 2.0, 3.0])
 
 
 class TestSerialConnection(unittest.TestCase):
@@ -73,6 +135,20 @@ class TestSerialConnection(unittest.TestCase):
         call_kwargs = mock_serial_class.call_args[1]
         self.assertEqual(call_kwargs['port'], "/dev/ttyUSB0")
         self.assertEqual(call_kwargs['baudrate'], 115200)
+        
+        # Low latency mode requested on the new port
+        mock_instance.set_low_latency_mode.assert_called_once_with(True)
+    
+    @patch('grbl.serial.serial.Serial')
+    def test_open_without_low_latency_support(self, mock_serial_class):
+        """Test open succeeds when the driver rejects low latency mode"""
+        mock_instance = Mock()
+        mock_instance.is_open = True
+        mock_instance.set_low_latency_mode.side_effect = OSError("not supported")
+        mock_serial_class.return_value = mock_instance
+        
+        result = self.serial_conn.open("/dev/ttyACM0", 115200)
+        self.assertTrue(result)
     
     @patch('grbl.serial.serial.Serial')
     def test_open_failure(self, mock_serial_class):
@@ -102,12 +178,27 @@ class TestSerialConnection(unittest.TestCase):
         self.assertEqual(bytes_written, 5)
         mock_instance.write.assert_called_once_with(b"test\n")
     
+    @patch('grbl.serial.serial.Serial')
+    def test_write_frames(self, mock_serial_class):
+        """Test several frames go out in one write"""
+        mock_instance = Mock()
+        mock_instance.is_open = True
+        mock_instance.write.return_value = 18
+        mock_serial_class.return_value = mock_instance
+        
+        self.serial_conn.open("/dev/test", 115200)
+        
+        bytes_written = self.serial_conn.write_frames([b"G0 X1\n", b"G0 Y2\n", b"$H\n", b"?"])
+        self.assertEqual(bytes_written, 18)
+        mock_instance.write.assert_called_once_with(b"G0 X1\nG0 Y2\n$H\n?")
+    
     @patch('grbl.serial.serial.Serial')
     def test_read_line(self, mock_serial_class):
         """Test reading line from serial port"""
         mock_instance = Mock()
         mock_instance.is_open = True
-        mock_instance.readline.return_value = b"ok\r\n"
+        mock_instance.in_waiting = 4
+        mock_instance.read.return_value = b"ok\r\n"
         mock_serial_class.return_value = mock_instance
         
         # Open connection first
@@ -116,7 +207,77 @@ class TestSerialConnection(unittest.TestCase):
         # Test read
         line = self.serial_conn.read_line()
         self.assertEqual(line, "ok")
-        mock_instance.readline.assert_called_once()
+        mock_instance.read.assert_called_once_with(4)
+    
+    @patch('grbl.serial.serial.Serial')
+    def test_read_line_bytes(self, mock_serial_class):
+        """Test reading a raw line without decoding"""
+        mock_instance = Mock()
+        mock_instance.is_open = True
+        mock_instance.in_waiting = 0
+        mock_instance.read.return_value = b"<Idle|MPos:0.000,0.000,0.000>\r\n"
+        mock_serial_class.return_value = mock_instance
+        
+        # Open connection first
+        self.serial_conn.open("/dev/test", 115200)
+        
+        # Test read
+        line = self.serial_conn.read_line_bytes()
+        self.assertEqual(line, b"<Idle|MPos:0.000,0.000,0.000>")
+    
+    @patch('grbl.serial.serial.Serial')
+    def test_read_line_buffers_extra_lines(self, mock_serial_class):
+        """Test lines arriving in one chunk are returned one at a time"""
+        mock_instance = Mock()
+        mock_instance.is_open = True
+        mock_instance.in_waiting = 0
+        mock_instance.read.side_effect = [b"ok\r\nerror:2\r\n<Id", b"le>\r\n", b""]
+        mock_serial_class.return_value = mock_instance
+        
+        # Open connection first
+        self.serial_conn.open("/dev/test", 115200)
+        
+        self.assertEqual(self.serial_conn.read_line(), "ok")
+        self.assertEqual(self.serial_conn.in_waiting(), len(b"error:2\r\n<Id"))
+        self.assertEqual(self.serial_conn.read_line(), "error:2")
+        # Only a partial line is buffered - nothing is readable yet
+        self.assertEqual(self.serial_conn.in_waiting(), 0)
+        self.assertEqual(self.serial_conn.read_line(), "<Idle>")
+        self.assertIsNone(self.serial_conn.read_line())
+    
+    @patch('grbl.serial.serial.Serial')
+    def test_read_line_trickle_honours_overall_timeout(self, mock_serial_class):
+        """Test a device sending bytes without a newline cannot outlast the timeout"""
+        mock_instance = Mock()
+        mock_instance.is_open = True
+        mock_instance.in_waiting = 0
+        
+        def trickle(size):
+            time.sleep(0.01)
+            return b"x"
+        mock_instance.read.side_effect = trickle
+        mock_serial_class.return_value = mock_instance
+        
+        self.serial_conn.open("/dev/test", 115200)
+        
+        started = time.perf_counter()
+        self.assertIsNone(self.serial_conn.read_line_bytes(timeout=0.05))
+        self.assertLess(time.perf_counter() - started, 0.5)
+    
+    @patch('grbl.serial.serial.Serial')
+    def test_read_lines_bytes_drains_in_one_pass(self, mock_serial_class):
+        """Test one unblocking read plus one drain yields every complete line"""
+        mock_instance = Mock()
+        mock_instance.is_open = True
+        mock_instance.in_waiting = 0
+        mock_instance.read.side_effect = [b"<Idle|MPos:0,0,0>\r\nok\r\n<Ru", b"n>\r\n", b""]
+        mock_serial_class.return_value = mock_instance
+        
+        self.serial_conn.open("/dev/test", 115200)
+        
+        self.assertEqual(self.serial_conn.read_lines_bytes(), [b"<Idle|MPos:0,0,0>", b"ok"])
+        self.assertEqual(self.serial_conn.read_lines_bytes(), [b"<Run>"])
+        self.assertEqual(self.serial_conn.read_lines_bytes(), [])
     
     @patch('grbl.serial.serial.Serial')
     def test_close_connection(self, mock_serial_class):
@@ -165,8 +326,8 @@ class TestGRBLController(unittest.TestCase):
     
     def setUp(self):
         # Create mocked dependencies
-        self.mock_serial = Mock(spec=SerialConnection)
-        self.mock_parser = Mock(spec=GRBLResponseParser)
+        self.mock_serial = _make_fake_serial()
+        self.mock_parser = _make_fake_parser()
         
         # Create controller with mocked dependencies
         self.controller = GRBLController(self.mock_serial, self.mock_parser)
@@ -177,7 +338,7 @@ class TestGRBLController(unittest.TestCase):
         self.mock_serial.is_open.return_value = True
         
         # Mock communicator to return successful response
-        with patch.object(self.controller._communicator, 'send_command_sync') as mock_send:
+        with _stub(self.controller, '_send_sync') as mock_send:
             mock_send.return_value = ["<Idle|MPos:0.000,0.000,0.000|WPos:0.000,0.000,0.000>", "ok"]
             
             result = self.controller.connect("/dev/ttyUSB0", 115200)
@@ -211,7 +372,7 @@ class TestGRBLController(unittest.TestCase):
         self.controller._is_connected = True
         self.mock_serial.is_open.return_value = True
         
-        with patch.object(self.controller._communicator, 'send_realtime_command') as mock_send:
+        with _stub(self.controller, '_send_rt') as mock_send:
             result = self.controller.emergency_stop()
             self.assertTrue(result)
             mock_send.assert_called_once_with("!")
@@ -221,7 +382,7 @@ class TestGRBLController(unittest.TestCase):
         self.controller._is_connected = True
         self.mock_parser.is_ok_response.return_value = True
         
-        with patch.object(self.controller._communicator, 'send_command_sync') as mock_send:
+        with _stub(self.controller, '_send_sync') as mock_send:
             mock_send.return_value = ["ok"]
             
             result = self.controller.home()
@@ -233,19 +394,32 @@ class TestGRBLController(unittest.TestCase):
         self.controller._is_connected = True
         self.mock_serial.is_open.return_value = True
         
-        with patch.object(self.controller._communicator, 'send_command_sync') as mock_send:
+        with _stub(self.controller, '_send_sync') as mock_send:
             mock_send.return_value = ["ok"]
             
             result = self.controller.move_to(x=10.0, y=20.0, z=5.0)
             self.assertTrue(result)
             mock_send.assert_called_once()
     
+    def test_move_to_command_format(self):
+        """Test move_to G-code formatting with and without feed rate"""
+        self.controller._is_connected = True
+
+        with _stub(self.controller, '_send_sync') as mock_send:
+            mock_send.return_value = ["ok"]
+
+            self.controller.move_to(x=1.0, y=-2.5, z=0.125)
+            self.assertEqual(mock_send.call_args[0][0], "G0 X1.000 Y-2.500 Z0.125")
+
+            self.controller.move_to(x=1.0, y=2.0, z=3.0, feed_rate=800)
+            self.assertEqual(mock_send.call_args[0][0], "G0 X1.000 Y2.000 Z3.000 F800")
+
     def test_jog_relative_command(self):
         """Test jog_relative command"""
         self.controller._is_connected = True
         self.mock_serial.is_open.return_value = True
         
-        with patch.object(self.controller._communicator, 'send_command_sync') as mock_send:
+        with _stub(self.controller, '_send_sync') as mock_send:
             mock_send.return_value = ["ok"]
             
             result = self.controller.jog_relative(x=1.0, y=-1.0, z=0.5)
@@ -257,7 +431,7 @@ class TestGRBLController(unittest.TestCase):
         """Test send_command"""
         self.controller._is_connected = True
         
-        with patch.object(self.controller._communicator, 'send_command_sync') as mock_send:
+        with _stub(self.controller, '_send_sync') as mock_send:
             mock_send.return_value = ["ok"]
             
             result = self.controller.send_command("G0 X10")
@@ -268,7 +442,7 @@ class TestGRBLController(unittest.TestCase):
         """Test send_command_async"""
         self.controller._is_connected = True
         
-        with patch.object(self.controller._communicator, 'send_command_async') as mock_send_async:
+        with _stub(self.controller, '_send_async') as mock_send_async:
             mock_future = Mock()
             mock_send_async.return_value = mock_future
             
@@ -280,7 +454,7 @@ class TestGRBLController(unittest.TestCase):
         """Test send_realtime_command"""
         self.controller._is_connected = True
         
-        with patch.object(self.controller._communicator, 'send_realtime_command') as mock_send:
+        with _stub(self.controller, '_send_rt') as mock_send:
             self.controller.send_realtime_command("!")
             mock_send.assert_called_once_with("!")
     
@@ -289,17 +463,92 @@ class TestGRBLController(unittest.TestCase):
         self.controller._is_connected = True
         self.controller.current_status = "Idle"
         
-        with patch.object(self.controller._communicator, 'send_command_sync') as mock_send:
+        with _stub(self.controller, '_send_sync') as mock_send:
             mock_send.return_value = ["<Idle|MPos:0.000,0.000,0.000|WPos:0.000,0.000,0.000>"]
             
             status = self.controller.get_status()
             self.assertEqual(status, "Idle")
     
+    def test_get_status_cached_until_command_sent(self):
+        """Test back-to-back get_status reuses the reply until a command is written"""
+        self.controller._is_connected = True
+        self.mock_serial.is_open.return_value = True
+        communicator = SimpleNamespace(query_status=Mock(return_value={'state': 'Run'}),
+                                       last_command_ns=0)
+        
+        with _stub(self.controller, '_communicator', communicator):
+            self.assertEqual(self.controller.get_status(), "Run")
+            self.assertEqual(self.controller.get_status(), "Run")
+            self.assertEqual(communicator.query_status.call_count, 1)
+            
+            communicator.last_command_ns = time.monotonic_ns()
+            self.controller.get_status()
+            self.assertEqual(communicator.query_status.call_count, 2)
+    
+    def test_get_position_reuses_status_report(self):
+        """Test get_status then get_position share one status query"""
+        self.controller._is_connected = True
+        self.mock_serial.is_open.return_value = True
+        communicator = SimpleNamespace(
+            query_status=Mock(return_value={'state': 'Idle', 'machine_position': [1.0, 2.0, 3.0]}),
+            last_command_ns=0)
+        
+        with _stub(self.controller, '_communicator', communicator):
+            self.assertEqual(self.controller.get_status(), "Idle")
+            position = self.controller.get_position()
+            self.assertEqual(position, [1.0, 2.0, 3.0])
+            communicator.query_status.assert_called_once()
+            
+            # Callers get a copy, not the cached list
+            position[0] = 99.0
+            self.assertEqual(self.controller.get_position()[0], 1.0)
+    
+    def test_wait_for_idle_wakes_on_status_report(self):
+        """Test wait_for_idle returns once the reader delivers an Idle report"""
+        self.controller._is_connected = True
+        self.mock_serial.is_open.return_value = True
+        report = {'state': 'Idle', 'machine_position': [0.0, 0.0, 0.0]}
+
+        with _stub(self.controller, '_send_rt') as mock_send:
+            mock_send.side_effect = lambda cmd: self.controller._handle_status_update(dict(report))
+            self.assertTrue(self.controller.wait_for_idle(timeout=1.0))
+            mock_send.assert_called_once_with("?")
+
+            report['state'] = 'Alarm'
+            self.assertFalse(self.controller.wait_for_idle(timeout=1.0))
+
+    def test_get_position_after_wait_for_idle_reuses_report(self):
+        """Test the Idle report that ends wait_for_idle also serves get_position"""
+        self.controller._is_connected = True
+        self.mock_serial.is_open.return_value = True
+        communicator = SimpleNamespace(query_status=Mock(), last_command_ns=0)
+        report = {'state': 'Idle', 'machine_position': [4.0, 5.0, 6.0]}
+
+        with _stub(self.controller, '_communicator', communicator), \
+                _stub(self.controller, '_send_rt') as mock_send:
+            def send_rt(cmd):
+                communicator.last_command_ns = time.monotonic_ns()
+                self.controller._handle_status_update(dict(report))
+            mock_send.side_effect = send_rt
+
+            self.assertTrue(self.controller.wait_for_idle(timeout=1.0))
+            self.assertEqual(self.controller.get_position(), [4.0, 5.0, 6.0])
+            communicator.query_status.assert_not_called()
+
+    def test_wait_for_idle_times_out_while_running(self):
+        """Test wait_for_idle gives up when no settled report arrives"""
+        self.controller._is_connected = True
+        self.mock_serial.is_open.return_value = True
+
+        with _stub(self.controller, '_send_rt') as mock_send:
+            self.assertFalse(self.controller.wait_for_idle(timeout=0.15))
+            self.assertGreaterEqual(mock_send.call_count, 2)
+
     def test_resume_command(self):
         """Test resume command"""
         self.controller._is_connected = True
         
-        with patch.object(self.controller._communicator, 'send_realtime_command') as mock_send:
+        with _stub(self.controller, '_send_rt') as mock_send:
             result = self.controller.resume()
             self.assertTrue(result)
             mock_send.assert_called_once_with("~")
@@ -308,10 +557,14 @@ class TestGRBLController(unittest.TestCase):
         """Test reset command"""
         self.controller._is_connected = True
         
-        with patch.object(self.controller._communicator, 'send_realtime_command') as mock_send:
+        with _stub(self.controller, '_send_rt') as mock_send:
+            # GRBL answers Ctrl-X with its startup banner
+            mock_send.side_effect = lambda cmd: self.controller._communicator._startup_event.set()
+            started = time.perf_counter()
             result = self.controller.reset()
             self.assertTrue(result)
             mock_send.assert_called_once_with("\x18")
+            self.assertLess(time.perf_counter() - started, 1.0)
 
 
 class TestGRBLControllerStandalone(unittest.TestCase):
@@ -373,6 +626,16 @@ class TestGRBLControllerStandalone(unittest.TestCase):
         
         with self.assertRaises(Exception):
             controller.send_realtime_command("!")
+    
+    def test_weakref_and_class_patching(self):
+        """Test the slotted controller supports weak references and class-level patch.object"""
+        controller = GRBLController()
+        self.assertIs(weakref.ref(controller)(), controller)
+        self.assertFalse(hasattr(controller, '__dict__'))
+        
+        with patch.object(GRBLController, 'home', return_value=True) as mock_home:
+            self.assertTrue(controller.home())
+            mock_home.assert_called_once_with()
 
 
 class TestGRBLComponentsIntegration(unittest.TestCase):
@@ -396,6 +659,22 @@ class TestGRBLComponentsIntegration(unittest.TestCase):
             self.assertEqual(result['state'], expected_state)
             self.assertEqual(result['machine_position'], expected_pos)
 
+    
+    def test_communicator_writes_bytes_commands_as_is(self):
+        """Test bytes commands skip encoding and str commands get one newline"""
+        from grbl.communicator import GRBLCommunicator
+        
+        serial_conn = _make_fake_serial()
+        serial_conn.is_open.return_value = True
+        communicator = GRBLCommunicator(serial_conn, GRBLResponseParser())
+        
+        communicator.send_command_async(b"$J=G91 X1.000", timeout=1.0)
+        communicator.send_command_async("G0 X10", timeout=1.0)
+        communicator.send_realtime_command(b"!")
+        
+        written = [c.args[0] for c in serial_conn.write.call_args_list]
+        self.assertEqual(written, [b"$J=G91 X1.000\n", b"G0 X10\n", b"!"])
+
 
 if __name__ == '__main__':
     # Run tests
@@ -1,34 +1,53 @@
 import unittest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import Mock
 import sys
 import os
+from types import SimpleNamespace
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+# Direct runs only - under pytest tests/conftest.py puts the project root on sys.path
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
 # Mock external dependencies
-sys.modules["serial"] = MagicMock()
-sys.modules["serial.tools"] = MagicMock()
-sys.modules["serial.tools.list_ports"] = MagicMock()
+from tests.grbl import _mock_serial  # noqa: F401
 
-from grbl.controller import GRBLController
 from grbl.smart_timeout_controller import SmartTimeoutController
-from grbl.timeout import TimeoutCalculator
+
+
+# Controller methods the smart controller touches - resolved once, not via spec per test
+_CONTROLLER_METHODS = (
+    "listen", "connect", "disconnect", "is_connected", "get_position", "get_status",
+    "home", "move_to", "jog_relative", "emergency_stop", "resume", "reset", "unlock",
+    "send_command", "send_command_async", "send_realtime_command",
+)
+
+
+def _make_fake_controller():
+    """Lightweight GRBLController double - avoids Mock(spec=...) introspection"""
+    fake = SimpleNamespace(**{name: Mock() for name in _CONTROLLER_METHODS})
+    fake.current_position = [0.0, 0.0, 0.0]
+    fake._parser = SimpleNamespace(is_ok_response=Mock(return_value=True))
+    return fake
+
+
+def _make_fake_timeout_calc():
+    """Lightweight TimeoutCalculator double"""
+    return SimpleNamespace(
+        timeout_history=[],
+        calculate_timeout=Mock(return_value=60.0),
+        record_execution_time=Mock(),
+        update_machine_config=Mock(),
+        get_statistics=Mock(return_value={"total_commands": 0}),
+        reset_history=Mock(),
+    )
 
 
 class TestSmartTimeoutController(unittest.TestCase):
     
     def setUp(self):
-        # Create mock base controller
-        self.mock_controller = Mock(spec=GRBLController)
-        self.mock_controller.current_position = [0.0, 0.0, 0.0]
-        self.mock_controller._parser = Mock()
-        self.mock_controller._parser.is_ok_response = Mock(return_value=True)
-        
-        # Create mock timeout calculator
-        self.mock_timeout_calc = Mock(spec=TimeoutCalculator)
-        self.mock_timeout_calc.calculate_timeout = Mock(return_value=60.0)
-        self.mock_timeout_calc.timeout_history = []
-        self.mock_timeout_calc.get_statistics = Mock(return_value={"total_commands": 0})
+        # Create fake base controller and timeout calculator
+        self.mock_controller = _make_fake_controller()
+        self.mock_timeout_calc = _make_fake_timeout_calc()
         
         # Create smart controller
         self.smart_controller = SmartTimeoutController(
@@ -133,6 +152,7 @@ class TestSmartTimeoutController(unittest.TestCase):
         
         self.assertEqual(result, ["ok"])
         self.mock_timeout_calc.calculate_timeout.assert_not_called()
+        self.mock_timeout_calc.record_execution_time.assert_not_called()
         self.mock_controller.send_command.assert_called_once_with("G0 X10", 5.0)
     
     def test_send_command_async_with_none_timeout(self):
@@ -226,13 +246,25 @@ class TestSmartTimeoutController(unittest.TestCase):
     
     def test_reset_timeout_statistics(self):
         self.smart_controller.reset_timeout_statistics()
-        self.assertEqual(len(self.mock_timeout_calc.timeout_history), 0)
+        self.mock_timeout_calc.reset_history.assert_called_once()
     
     def test_attribute_delegation_via_getattr(self):
         self.mock_controller.some_custom_attribute = "test_value"
         result = self.smart_controller.some_custom_attribute
         self.assertEqual(result, "test_value")
     
+    def test_delegated_methods_and_values_live(self):
+        self.mock_controller.custom_method = Mock(return_value=42)
+        self.assertEqual(self.smart_controller.custom_method(), 42)
+        self.mock_controller.custom_method = Mock(return_value=7)
+        self.assertEqual(self.smart_controller.custom_method(), 7)
+        self.assertNotIn("custom_method", vars(self.smart_controller))
+        
+        self.mock_controller.current_status = "Idle"
+        self.assertEqual(self.smart_controller.current_status, "Idle")
+        self.mock_controller.current_status = "Run"
+        self.assertEqual(self.smart_controller.current_status, "Run")
+    
     def test_auto_config_on_connect(self):
         self.mock_controller.send_command.return_value = [
             "$110=1000.000",
@@ -264,8 +296,7 @@ class TestSmartTimeoutControllerIntegration(unittest.TestCase):
     def test_interfaces_implemented(self):
         from grbl.interfaces import IGRBLConnection, IGRBLStatus, IGRBLMovement, IGRBLCommunication
         
-        mock_controller = Mock(spec=GRBLController)
-        mock_controller.current_position = [0.0, 0.0, 0.0]
+        mock_controller = _make_fake_controller()
         
         smart_controller = SmartTimeoutController(mock_controller)
         
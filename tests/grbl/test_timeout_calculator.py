@@ -4,12 +4,13 @@ Save as: tests/test_timeout_calculator.py
 """
 import unittest
 import math
-from unittest.mock import Mock
+from dataclasses import replace
 import sys
 import os
 
-# Add project root to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..','..')))
+# Direct runs only - under pytest tests/conftest.py puts the project root on sys.path
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
 # Import directly from specific files to avoid package dependencies
 from grbl.config import GRBLMachineConfig, GRBLConfigParser
@@ -18,10 +19,39 @@ from grbl.timeout.movement_calculator import MovementCalculator, SafetyMarginPro
 from grbl.timeout.calculator import TimeoutCalculator, TimeoutCalculatorService
 
 
+# Known 4-axis machine for movement timing tests
+_MOVEMENT_CONFIG = GRBLMachineConfig(
+    max_rate_x=1000.0,
+    max_rate_y=1000.0,
+    max_rate_z=500.0,
+    max_rate_a=3600.0,      # 60 degrees/sec
+    acceleration_x=10.0,
+    acceleration_y=10.0,
+    acceleration_z=5.0,
+    acceleration_a=360.0,   # 6 degrees/sec²
+    default_feed_rate=800.0,
+    has_rotary_a=True
+)
+
+
+class _FakeGRBL:
+    """Plain controller double - records sent commands without Mock bookkeeping"""
+    
+    def __init__(self):
+        self.current_position = [0.0, 0.0, 0.0]
+        self.sent = []
+    
+    def send_command(self, command, timeout=None):
+        self.sent.append((command, timeout))
+        return ["ok"]
+
+
 class TestGRBLConfigParser(unittest.TestCase):
     
-    def setUp(self):
-        self.parser = GRBLConfigParser()
+    @classmethod
+    def setUpClass(cls):
+        # Parser is stateless - share one instance across the class
+        cls.parser = GRBLConfigParser()
     
     def test_parse_basic_settings(self):
         """Test parsing of basic GRBL settings (4-axis)"""
@@ -91,6 +121,20 @@ class TestGRBLConfigParser(unittest.TestCase):
         # Other values should remain defaults
         self.assertEqual(config.max_rate_y, 1000.0)  # Default
     
+    def test_parse_settings_with_descriptions(self):
+        """Test Grbl 0.9 style lines with trailing descriptions"""
+        settings = [
+            "$110=1500.000 (x max rate, mm/min)",
+            "  $120=25.000 (x accel, mm/sec^2)",
+            "$121=abc (y accel, mm/sec^2)",  # Unparseable value
+        ]
+        
+        config = self.parser.parse_settings(settings)
+        
+        self.assertEqual(config.max_rate_x, 1500.0)
+        self.assertEqual(config.acceleration_x, 25.0)
+        self.assertEqual(config.acceleration_y, GRBLMachineConfig().acceleration_y)  # Default
+    
     def test_default_config(self):
         """Test default configuration creation"""
         config = self.parser.create_default_config()
@@ -103,9 +147,11 @@ class TestGRBLConfigParser(unittest.TestCase):
 
 class TestCommandAnalyzer(unittest.TestCase):
     
-    def setUp(self):
-        self.analyzer = CommandAnalyzer()
-        self.current_pos = (0.0, 0.0, 0.0, 0.0)  # 4-axis position
+    @classmethod
+    def setUpClass(cls):
+        # Analyzer is stateless - share one instance across the class
+        cls.analyzer = CommandAnalyzer()
+        cls.current_pos = (0.0, 0.0, 0.0, 0.0)  # 4-axis position
     
     def test_parse_rapid_move(self):
         """Test parsing G0 rapid move commands (4-axis)"""
@@ -205,18 +251,8 @@ class TestCommandAnalyzer(unittest.TestCase):
 class TestMovementCalculator(unittest.TestCase):
     
     def setUp(self):
-        self.config = GRBLMachineConfig(
-            max_rate_x=1000.0,
-            max_rate_y=1000.0,
-            max_rate_z=500.0,
-            max_rate_a=3600.0,      # 60 degrees/sec
-            acceleration_x=10.0,
-            acceleration_y=10.0,
-            acceleration_z=5.0,
-            acceleration_a=360.0,   # 6 degrees/sec²
-            default_feed_rate=800.0,
-            has_rotary_a=True
-        )
+        # Fresh copy per test - some tests mutate the config
+        self.config = replace(_MOVEMENT_CONFIG)
         self.calculator = MovementCalculator(self.config)
         self.current_pos = (0.0, 0.0, 0.0, 0.0)  # 4-axis position
     
@@ -308,6 +344,21 @@ class TestMovementCalculator(unittest.TestCase):
         self.assertGreater(time, 20.0)
         self.assertLess(time, 300.0)
     
+    def test_homing_time_cache_invalidation(self):
+        """Test cached homing time follows config changes"""
+        parsed_cmd = ParsedCommand(command_type=CommandType.HOMING, raw_command="$H")
+        original_time = self.calculator.calculate_movement_time(parsed_cmd, self.current_pos)
+
+        # In-place field change - picked up by invalidate_cache
+        self.config.homing_seek_rate *= 2
+        self.calculator.invalidate_cache()
+        faster_time = self.calculator.calculate_movement_time(parsed_cmd, self.current_pos)
+        self.assertLess(faster_time, original_time)
+
+        # Assigning a new config refreshes the cache on its own
+        self.calculator.config = replace(self.config, homing_seek_rate=self.config.homing_seek_rate * 2)
+        self.assertLess(self.calculator.calculate_movement_time(parsed_cmd, self.current_pos), faster_time)
+
     def test_trapezoidal_profile_full_acceleration(self):
         """Test trapezoidal profile with full acceleration phase"""
         # Long distance that allows full acceleration
@@ -336,8 +387,10 @@ class TestMovementCalculator(unittest.TestCase):
 
 class TestSafetyMarginProvider(unittest.TestCase):
     
-    def setUp(self):
-        self.safety = SafetyMarginProvider()
+    @classmethod
+    def setUpClass(cls):
+        # Provider is never mutated by these tests - share one instance
+        cls.safety = SafetyMarginProvider()
     
     def test_apply_safety_margin_rapid_move(self):
         """Test safety margin for rapid moves"""
@@ -434,6 +487,27 @@ class TestTimeoutCalculator(unittest.TestCase):
         self.assertEqual(self.calculator.config.max_rate_a, 7200.0)
         self.assertNotEqual(self.calculator.config.max_rate_a, old_max_rate_a)
     
+    def test_timeout_cache_invalidated_on_config_update(self):
+        """Test memoized timeouts are recomputed after a config change"""
+        before = self.calculator.calculate_timeout("G1 X100 F6000", (0, 0, 0, 0))
+        self.assertEqual(self.calculator.calculate_timeout("G1 X100 F6000", [0, 0, 0, 0]), before)
+        
+        self.calculator.update_machine_config(["$120=5.000"])  # Much slower X acceleration
+        after = self.calculator.calculate_timeout("G1 X100 F6000", (0, 0, 0, 0))
+        self.assertGreater(after, before)
+    
+    def test_timeout_cache_follows_direct_changes(self):
+        """Test tuning the safety provider or assigning a config bypasses stale entries"""
+        before = self.calculator.calculate_timeout("G4 P0.1")
+        self.calculator.safety_provider.minimum_timeout = 7.0
+        self.assertEqual(self.calculator.calculate_timeout("G4 P0.1"), 7.0)
+        self.assertNotEqual(before, 7.0)
+        
+        move = self.calculator.calculate_timeout("G1 X100 F6000", (0, 0, 0, 0))
+        self.calculator.config = replace(self.config, acceleration_x=5.0)
+        self.assertGreater(self.calculator.calculate_timeout("G1 X100 F6000", (0, 0, 0, 0)), move)
+        self.assertIs(self.calculator.movement_calculator.config, self.calculator.config)
+    
     def test_record_execution_time(self):
         """Test execution time recording for adaptive learning"""
         command = "G0 X10"
@@ -458,14 +532,35 @@ class TestTimeoutCalculator(unittest.TestCase):
         new_factor = self.calculator.safety_provider.base_safety_factor
         self.assertLess(new_factor, original_factor)
 
+    
+    def test_history_keeps_most_recent_executions(self):
+        """Test the execution history is bounded and drops the oldest entries"""
+        limit = self.calculator.max_history
+        for i in range(limit + 5):
+            self.calculator.record_execution_time(f"G0 X{i}", 5.0, 5.0)
+        
+        self.assertEqual(self.calculator.get_statistics()['total_commands'], limit)
+        self.assertEqual(self.calculator.timeout_history[0]['command'], "G0 X5")
+    
+    def test_accuracy_ewma_weights_recent_executions(self):
+        """Test the running accuracy is an EWMA and resets with the history"""
+        self.calculator.record_execution_time("G0 X1", 5.0, 5.0)   # 1.0
+        self.calculator.record_execution_time("G0 X2", 5.0, 10.0)  # 2.0
+        
+        stats = self.calculator.get_statistics()
+        self.assertAlmostEqual(stats['accuracy_ewma'], 0.2 * 2.0 + 0.8 * 1.0)
+        
+        self.calculator.reset_history()
+        self.assertEqual(self.calculator.get_statistics(), {'total_commands': 0})
+        self.calculator.record_execution_time("G0 X3", 5.0, 7.5)
+        self.assertAlmostEqual(self.calculator.get_statistics()['accuracy_ewma'], 1.5)
+
 
 class TestTimeoutCalculatorService(unittest.TestCase):
     
     def setUp(self):
-        # Mock GRBL controller
-        self.mock_grbl = Mock()
-        self.mock_grbl.current_position = [0.0, 0.0, 0.0]
-        self.mock_grbl.send_command.return_value = ["ok"]
+        # Fake GRBL controller
+        self.mock_grbl = _FakeGRBL()
         
         # Create service
         self.service = TimeoutCalculatorService(self.mock_grbl)
@@ -475,12 +570,12 @@ class TestTimeoutCalculatorService(unittest.TestCase):
         self.service.send_command("G0 X10")
         
         # Should call underlying controller with calculated timeout
-        self.mock_grbl.send_command.assert_called_once()
-        args, kwargs = self.mock_grbl.send_command.call_args
+        self.assertEqual(len(self.mock_grbl.sent), 1)
+        command, timeout = self.mock_grbl.sent[0]
         
-        self.assertEqual(args[0], "G0 X10")
-        self.assertIsInstance(args[1], float)  # Timeout should be calculated
-        self.assertGreater(args[1], 0.0)
+        self.assertEqual(command, "G0 X10")
+        self.assertIsInstance(timeout, float)  # Timeout should be calculated
+        self.assertGreater(timeout, 0.0)
     
     def test_send_command_with_custom_timeout(self):
         """Test send_command respects custom timeout"""
@@ -488,7 +583,7 @@ class TestTimeoutCalculatorService(unittest.TestCase):
         self.service.send_command("G0 X100", custom_timeout)
         
         # Should use custom timeout
-        self.mock_grbl.send_command.assert_called_once_with("G0 X100", custom_timeout)
+        self.assertEqual(self.mock_grbl.sent, [("G0 X100", custom_timeout)])
     
     def test_4axis_position_handling(self):
         """Test proper handling of 4-axis positions"""
@@ -497,7 +592,7 @@ class TestTimeoutCalculatorService(unittest.TestCase):
         self.service.send_command("G1 A90")
         
         # Should extend 3-axis to 4-axis internally
-        self.mock_grbl.send_command.assert_called_once()
+        self.assertEqual(len(self.mock_grbl.sent), 1)
     
     def test_attribute_delegation(self):
         """Test that other attributes are delegated to wrapped controller"""
@@ -517,9 +612,19 @@ class TestTimeoutCalculatorService(unittest.TestCase):
 class TestIntegration(unittest.TestCase):
     """Integration tests for the complete timeout calculation system"""
     
-    def test_end_to_end_calculation(self):
-        """Test complete workflow from command to timeout (4-axis)"""
-        # Create calculator with known 4-axis config
+    # 4-axis commands and their expected timeouts (value or predicate)
+    CASES = [
+        ("?", 2.0),                    # Status query - fixed
+        ("$$", 5.0),                   # Settings - fixed  
+        ("$H", lambda t: t > 30.0),    # Homing - calculated, long
+        ("G0 X10 A90", lambda t: 1.0 < t < 10.0),        # 4-axis rapid move
+        ("G1 X100 A180 F300", lambda t: t > 15.0),       # Slow 4-axis move
+        ("G1 A360 F1800", lambda t: 5.0 < t < 25.0),     # Rotary-only move
+    ]
+    
+    @classmethod
+    def setUpClass(cls):
+        # Create calculator with known 4-axis config - built once for all cases
         config = GRBLMachineConfig(
             max_rate_x=1000.0,
             max_rate_a=3600.0,      # Fast rotary
@@ -528,25 +633,18 @@ class TestIntegration(unittest.TestCase):
             acceleration_a=360.0,
             has_rotary_a=True
         )
-        calculator = TimeoutCalculator(config)
-        
-        # Test various 4-axis commands
-        test_cases = [
-            ("?", 2.0),                    # Status query - fixed
-            ("$$", 5.0),                   # Settings - fixed  
-            ("$H", lambda t: t > 30.0),    # Homing - calculated, long
-            ("G0 X10 A90", lambda t: 1.0 < t < 10.0),        # 4-axis rapid move
-            ("G1 X100 A180 F300", lambda t: t > 15.0),       # Slow 4-axis move
-            ("G1 A360 F1800", lambda t: 5.0 < t < 25.0),     # Rotary-only move
-        ]
-        
-        for command, expected in test_cases:
-            timeout = calculator.calculate_timeout(command)
-            
-            if callable(expected):
-                self.assertTrue(expected(timeout), f"Command '{command}' timeout {timeout} failed expectation")
-            else:
-                self.assertEqual(timeout, expected, f"Command '{command}' timeout mismatch")
+        cls.calculator = TimeoutCalculator(config)
+    
+    def test_end_to_end_calculation(self):
+        """Test complete workflow from command to timeout (4-axis)"""
+        for command, expected in self.CASES:
+            with self.subTest(command=command):
+                timeout = self.calculator.calculate_timeout(command)
+                
+                if callable(expected):
+                    self.assertTrue(expected(timeout), f"Command '{command}' timeout {timeout} failed expectation")
+                else:
+                    self.assertEqual(timeout, expected, f"Command '{command}' timeout mismatch")
 
 
 if __name__ == '__main__':
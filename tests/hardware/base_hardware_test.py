@@ -3,11 +3,12 @@ Base Hardware Test Class
 Provides common functionality for hardware testing
 """
 import unittest
+import math
 import time
 import sys
 import os
-from typing import Optional
-from datetime import datetime
+from collections import deque
+from typing import List, Optional
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
@@ -18,12 +19,19 @@ from tests.hardware.test_config import get_hardware_config, is_hardware_availabl
 
 def log_with_timestamp(message: str):
     """Print message with timestamp"""
-    timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
+    # time.strftime + millis avoids building a datetime and slicing %f
+    now = time.time()
+    timestamp = f"{time.strftime('%H:%M:%S', time.localtime(now))}.{int(now % 1 * 1000):03d}"
     print(f"{timestamp} {message}")
 
 
 class BaseHardwareTest(unittest.TestCase):
     """Base class for hardware tests with safety features"""
+    
+    GRBL_RX_BUFFER = 127  # GRBL serial RX buffer (128) less one - character-counting limit
+    HW_GROUP = "cnc"  # Shares the serial port - one xdist worker per group
+    STOPPED_STATES = ('Idle', 'Hold:0', 'Alarm')  # Settled after a feed hold - Jog/Hold:1 still decelerating
+    _connected = False  # Set once connect() succeeds, cleared on disconnect
 
 
     @classmethod
@@ -32,6 +40,14 @@ class BaseHardwareTest(unittest.TestCase):
         cls.config = get_hardware_config()
         cls.controller: Optional[GRBLController] = None
         
+        # Safe workspace bounds per axis, resolved once for every bounds check
+        cls._bounds = (
+            ('X', cls.config.min_x, cls.config.max_x),
+            ('Y', cls.config.min_y, cls.config.max_y),
+            ('Z', cls.config.min_z, cls.config.max_z),
+        )
+        cls._max_dist_sq = cls.config.max_test_distance ** 2
+        
         # Skip if hardware not available
         if not is_hardware_available():
             raise unittest.SkipTest(f"Hardware not available on port {cls.config.port}")
@@ -49,17 +65,19 @@ class BaseHardwareTest(unittest.TestCase):
         cls.controller = GRBLController()
         if not cls.controller.connect(cls.config.port, cls.config.baudrate):
             raise unittest.SkipTest(f"Failed to connect to hardware on {cls.config.port}")
+        cls._connected = True
         
         log_with_timestamp(f"✅ Connected to CNC hardware on {cls.config.port}")
     
     @classmethod
     def tearDownClass(cls):
         """Clean up hardware connection"""
-        if cls.controller and cls.controller.is_connected():
-            # Emergency stop and disconnect
+        if cls._connected:
+            # Emergency stop and disconnect once motion has stopped
             cls.controller.emergency_stop()
-            time.sleep(0.5)
+            cls.wait_until(lambda: cls.controller.get_status() in cls.STOPPED_STATES, timeout=2.0)
             cls.controller.disconnect()
+            cls._connected = False
             log_with_timestamp("✅ Disconnected from hardware")
     
     def setUp(self):
@@ -75,42 +93,28 @@ class BaseHardwareTest(unittest.TestCase):
             self.initial_position = [0.0, 0.0, 0.0]
             self.initial_status = 'Unknown'
         
-        log_with_timestamp(f"📍 Initial position: {self.initial_position}")
-        log_with_timestamp(f"📊 Initial status: {self.initial_status}")
+        if self.config.verbose:
+            log_with_timestamp(f"📍 Initial position: {self.initial_position}")
+            log_with_timestamp(f"📊 Initial status: {self.initial_status}")
         
         # Clear Alarm state if present
         if self.initial_status == 'Alarm':
             log_with_timestamp("⚠️  Clearing Alarm state with unlock command")
             try:
-                if self.controller.unlock():
-                    time.sleep(0.3)
-                    
-                    # Verify alarm cleared
-                    status_data = self.controller._communicator.query_status(timeout=0.2)
-                    if status_data:
-                        new_status = status_data.get('state', 'Unknown')
-                        log_with_timestamp(f"✅ Status after unlock: {new_status}")
-                        self.initial_status = new_status
-                        
-                        if new_status == 'Alarm':
-                            self.skipTest("Could not clear Alarm state - machine may need manual reset")
-                else:
-                    self.skipTest("Unlock command failed - machine in Alarm state")
+                self.initial_status = self._ensure_clear_state(self.initial_status)
             except Exception as e:
                 log_with_timestamp(f"❌ Failed to clear alarm: {e}")
                 self.skipTest(f"Exception during unlock: {e}")
+            
+            log_with_timestamp(f"✅ Status after unlock: {self.initial_status}")
+            if self.initial_status == 'Alarm':
+                self.skipTest("Could not clear Alarm state - machine may need manual reset")
         
         # Ensure machine is in safe state
         elif self.initial_status.startswith('Hold'):
             log_with_timestamp("⚠️  Clearing Hold state")
-            self.controller.resume()
-            time.sleep(0.2)
-            
-            # Verify hold cleared
-            status_data = self.controller._communicator.query_status(timeout=0.2)
-            if status_data:
-                self.initial_status = status_data.get('state', 'Unknown')
-                log_with_timestamp(f"✅ Status after resume: {self.initial_status}")
+            self.initial_status = self._ensure_clear_state(self.initial_status)
+            log_with_timestamp(f"✅ Status after resume: {self.initial_status}")
     
     def tearDown(self):
         """Clean up after individual test"""
@@ -127,8 +131,7 @@ class BaseHardwareTest(unittest.TestCase):
                 # Clear Alarm state if present
                 if status == 'Alarm':
                     log_with_timestamp("⚠️  Test left machine in Alarm - clearing")
-                    if self.controller.unlock():
-                        time.sleep(0.2)
+                    if self._ensure_clear_state(status) != 'Alarm':
                         log_with_timestamp("✅ Alarm cleared in tearDown")
                     else:
                         log_with_timestamp("⚠️  Failed to clear alarm in tearDown")
@@ -136,58 +139,133 @@ class BaseHardwareTest(unittest.TestCase):
                 # Clear Hold state if present
                 elif status.startswith('Hold'):
                     log_with_timestamp("⚠️  Test left machine in Hold - resuming")
-                    self.controller.resume()
-                    time.sleep(0.2)
+                    self._ensure_clear_state(status)
                     log_with_timestamp("✅ Hold cleared in tearDown")
     
-    def safe_move_relative(self, x: float = 0, y: float = 0, z: float = 0, feed_rate: float = 500):
-        """Safely move relative with bounds checking"""
-        # Check bounds
-        current_pos = self.controller.get_position()
-        new_x = current_pos[0] + x
-        new_y = current_pos[1] + y
-        new_z = current_pos[2] + z
+    def _poll_state(self, done, timeout: float) -> str:
+        """Query state with backoff until done(state) holds - returns the last state seen"""
+        state = 'Unknown'
         
-        # Validate within safe bounds
-        if not (self.config.min_x <= new_x <= self.config.max_x):
-            raise ValueError(f"X movement {new_x} outside safe bounds [{self.config.min_x}, {self.config.max_x}]")
+        def check():
+            nonlocal state
+            status_data = self.controller._communicator.query_status(timeout=0.2)
+            state = status_data.get('state', 'Unknown') if status_data else 'Unknown'
+            return done(state)
+        
+        self.wait_until(check, timeout)
+        return state
+    
+    def _ensure_clear_state(self, state: str) -> str:
+        """Unlock an Alarm or resume a Hold - re-queries only when a recovery ran"""
+        if state == 'Alarm':
+            if not self.controller.unlock():
+                return state
+            return self._poll_state(lambda s: s != 'Alarm', timeout=0.3)
         
-        if not (self.config.min_y <= new_y <= self.config.max_y):
-            raise ValueError(f"Y movement {new_y} outside safe bounds [{self.config.min_y}, {self.config.max_y}]")
+        if state.startswith('Hold'):
+            self.controller.resume()
+            return self._poll_state(lambda s: not s.startswith('Hold'), timeout=0.2)
         
-        if not (self.config.min_z <= new_z <= self.config.max_z):
-            raise ValueError(f"Z movement {new_z} outside safe bounds [{self.config.min_z}, {self.config.max_z}]")
+        return state
+    
+    def _check_move(self, start: list, x: float, y: float, z: float) -> list:
+        """Raise ValueError if a relative move leaves the safe workspace - returns the target"""
+        # Validate within safe bounds
+        target = []
+        for (axis, low, high), begin, delta in zip(self._bounds, start, (x, y, z)):
+            new_value = begin + delta
+            if not (low <= new_value <= high):
+                raise ValueError(f"{axis} movement {new_value} outside safe bounds [{low}, {high}]")
+            target.append(new_value)
         
-        # Check movement distance
-        distance = (x**2 + y**2 + z**2)**0.5
-        if distance > self.config.max_test_distance:
+        # Check movement distance - squared, the sqrt is only needed for the message
+        if x * x + y * y + z * z > self._max_dist_sq:
+            distance = math.hypot(x, y, z)
             raise ValueError(f"Movement distance {distance:.2f}mm exceeds max {self.config.max_test_distance}mm")
         
+        return target
+    
+    def safe_move_relative(self, x: float = 0, y: float = 0, z: float = 0, feed_rate: float = 500):
+        """Safely move relative with bounds checking"""
+        # Check bounds - after wait_for_idle this reuses the Idle report, no extra query
+        self._check_move(self.controller.get_position(), x, y, z)
+        
         # Perform safe movement
         return self.controller.jog_relative(x, y, z, min(feed_rate, self.config.max_feed_rate))
     
-    def wait_for_idle(self, timeout: float = 30.0) -> bool:
-        """Wait for machine to reach idle state"""
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
-            status = self.controller.get_status()
-            if status == 'Idle':
-                return True
-            elif status in ['Alarm', 'Error']:
+    def safe_move_sequence(self, moves: List[dict], feed_rate: float = 500) -> bool:
+        """Stream several checked relative jogs, then wait for idle once
+        
+        Each move is a dict of x/y/z deltas. Every step is bounds-checked before
+        anything is sent; lines are streamed with GRBL character counting so the
+        unacknowledged bytes never exceed the controller's RX buffer.
+        """
+        position = self.controller.get_position()
+        feed = min(feed_rate, self.config.max_feed_rate)
+        
+        commands = []
+        for move in moves:
+            x, y, z = move.get('x', 0), move.get('y', 0), move.get('z', 0)
+            position = self._check_move(position, x, y, z)
+            commands.append(GRBLController.JOG_FORMAT(x, y, z, feed))
+        
+        in_flight = deque()  # (future, bytes in GRBL's RX buffer)
+        buffered = 0
+        acked = True
+        for command in commands:
+            size = len(command) + 1  # Trailing newline
+            while acked and in_flight and buffered + size > self.GRBL_RX_BUFFER:
+                future, sent = in_flight.popleft()
+                acked = self._jog_acked(future)
+                buffered -= sent
+            if not acked:
+                break  # GRBL rejected a jog - the remaining relative moves would land off-plan
+            in_flight.append((self.controller.send_command_async(command, timeout=10.0), size))
+            buffered += size
+        
+        for future, _ in in_flight:
+            acked = self._jog_acked(future) and acked
+        
+        # Always let accepted jogs finish before returning - stop the machine if they do not
+        idle = self.wait_for_idle()
+        if not idle:
+            self.controller.emergency_stop()
+        return acked and idle
+    
+    def _jog_acked(self, future) -> bool:
+        """Wait for one streamed jog line and report whether GRBL accepted it"""
+        try:
+            return any(self.controller._parser.is_ok_response(r) for r in future.result(timeout=10.0))
+        except Exception:
+            return False
+    
+    @staticmethod
+    def wait_until(condition, timeout: float) -> bool:
+        """Poll condition until it holds - starts at 5ms, backs off to 100ms"""
+        deadline = time.perf_counter_ns() + int(timeout * 1e9)  # Integer compare in the poll
+        poll_interval = 0.005
+        
+        while not condition():
+            if time.perf_counter_ns() >= deadline:
                 return False
-            time.sleep(0.1)
+            time.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, 0.1)
         
-        return False
+        return True
+    
+    def wait_for_idle(self, timeout: float = 30.0) -> bool:
+        """Wait for machine to reach idle state - event-driven via the controller"""
+        return self.controller.wait_for_idle(timeout)
     
     def assert_position_near(self, expected_position: list, tolerance: float = 0.1):
         """Assert current position is near expected position within tolerance"""
         actual_position = self.controller.get_position()
         
-        for i, (actual, expected) in enumerate(zip(actual_position, expected_position)):
-            self.assertAlmostEqual(
-                actual, expected, delta=tolerance,
-                msg=f"Axis {i}: expected {expected:.3f}, got {actual:.3f}, tolerance {tolerance}"
-            )
+        # One pass over the axes; the message is formatted only when one is off
+        bad = [i for i, (actual, expected) in enumerate(zip(actual_position, expected_position))
+               if abs(actual - expected) > tolerance]
+        if bad:
+            self.fail(f"Axes {bad} out of tolerance {tolerance}: "
+                      f"expected {expected_position}, got {actual_position}")
 
 BaseHardwareTest.config=None
\ No newline at end of file
@@ -5,7 +5,8 @@ Helper script to run hardware tests for SmartTimeoutController
 """
 import sys
 import os
-import subprocess
+import importlib
+import unittest
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
@@ -30,18 +31,12 @@ def main():
     print("="*70)
     print()
     
-    # Run the tests
-    test_file = os.path.join(
-        os.path.dirname(__file__),
-        "test_smart_timeout_hardware.py"
-    )
+    # Run the tests in-process - no second interpreter re-importing serial/cv2
+    module = importlib.import_module("tests.hardware.test_smart_timeout_hardware")
+    suite = unittest.TestLoader().loadTestsFromModule(module)
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
     
-    result = subprocess.run(
-        [sys.executable, test_file],
-        cwd=os.path.dirname(test_file)
-    )
-    
-    sys.exit(result.returncode)
+    sys.exit(0 if result.wasSuccessful() else 1)
 
 if __name__ == "__main__":
     main()
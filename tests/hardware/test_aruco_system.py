@@ -3,42 +3,57 @@
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from cv import CalibratedCameraManager
-from cv.aruco import ArUcoDetector, ArUcoRenderer, ArUcoEvents
-import cv2
+HW_GROUP = "camera"  # Shares /dev/video0 with the calibrated camera tests
+CALIBRATION_FILE = "data/calibration/endo.npz"
 
-def test_aruco_detection_only():
-    print("Testing ArUco detection...")
+# Bound by _open_camera() - collection never loads OpenCV
+cv2 = CalibratedCameraManager = ArUcoDetector = ArUcoRenderer = ArUcoEvents = None
+
+def _import_cv():
+    global cv2, CalibratedCameraManager, ArUcoDetector, ArUcoRenderer, ArUcoEvents
+    import cv2
+    from cv import CalibratedCameraManager
+    from cv.aruco import ArUcoDetector, ArUcoRenderer, ArUcoEvents
+
+def _open_camera():
+    _import_cv()
     camera = CalibratedCameraManager(camera_id=0)
-    camera.load_calibration("data/calibration/endo.npz")
+    camera.load_calibration(CALIBRATION_FILE)
     camera.connect()
+    return camera
+
+# Under pytest the module-scoped `camera` fixture (tests/conftest.py) calls _open_camera()
+
+def test_aruco_detection_only(camera):
+    print("Testing ArUco detection...")
     detector = ArUcoDetector(marker_size_mm=15.0)
     detector.set_calibration(*camera.get_calibration())
     detector.listen(ArUcoEvents.MARKERS_DETECTED, lambda r: print(f"  ✓ {len(r.markers)} markers"))
     frame = camera.capture_frame()
     result = detector.detect(frame)
-    camera.disconnect()
     print(f"Result: {len(result.markers)} markers\n")
 
-def test_aruco_with_rendering():
+def test_aruco_with_rendering(camera):
     print("Testing ArUco rendering...")
-    camera = CalibratedCameraManager(camera_id=0)
-    camera.load_calibration("data/calibration/endo.npz")
-    camera.connect()
     detector = ArUcoDetector(marker_size_mm=15.0)
     detector.set_calibration(*camera.get_calibration())
     renderer = ArUcoRenderer()
     frame = camera.capture_frame()
     detection = detector.detect(frame)
     annotated = renderer.render(frame, detection)
-    cv2.imwrite("../tmp/aruco_test_output.jpg", annotated)
+    # Debug artifact - quality 80 without Huffman optimisation encodes faster than the default 95
+    cv2.imwrite("../tmp/aruco_test_output.jpg", annotated,
+                [cv2.IMWRITE_JPEG_QUALITY, 80, cv2.IMWRITE_JPEG_OPTIMIZE, 0])
     print(f"  ✓ Saved tmp/aruco_test_output.jpg\n")
-    camera.disconnect()
 
 if __name__ == "__main__":
     print("="*60)
     print("ArUco System Tests")
     print("="*60)
-    test_aruco_detection_only()
-    test_aruco_with_rendering()
+    camera = _open_camera()
+    try:
+        test_aruco_detection_only(camera)
+        test_aruco_with_rendering(camera)
+    finally:
+        camera.disconnect()
     print("✓ Tests completed")
@@ -3,13 +3,14 @@ Hardware Test Configuration
 Configure real hardware settings for testing
 """
 import os
+from functools import lru_cache
 from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class HardwareTestConfig:
-    """Configuration for hardware testing"""
+    """Configuration for hardware testing (shared, so frozen - use dataclasses.replace)"""
     # Serial connection
     port: str = "/dev/ttyUSB0"  # Windows default, adjust as needed
     baudrate: int = 115200
@@ -37,25 +38,40 @@ class HardwareTestConfig:
     # Test control
     skip_destructive_tests: bool = True
     require_manual_confirmation: bool = True
+    verbose: bool = True  # Per-test position/status logging
 
 
+@lru_cache(maxsize=1)
 def get_hardware_config() -> HardwareTestConfig:
-    """Get hardware configuration from environment or defaults"""
-    config = HardwareTestConfig()
-    
+    """Get hardware configuration from environment or defaults (built once per run)"""
     # Override from environment variables if present
-    config.port = os.getenv("CNC_TEST_PORT", config.port)
-    config.baudrate = int(os.getenv("CNC_TEST_BAUDRATE", str(config.baudrate)))
-    config.skip_destructive_tests = os.getenv("CNC_SKIP_DESTRUCTIVE", "true").lower() == "true"
+    return HardwareTestConfig(
+        port=os.getenv("CNC_TEST_PORT", HardwareTestConfig.port),
+        baudrate=int(os.getenv("CNC_TEST_BAUDRATE", str(HardwareTestConfig.baudrate))),
+        skip_destructive_tests=os.getenv("CNC_SKIP_DESTRUCTIVE", "true").lower() == "true",
+        verbose=os.getenv("CNC_TEST_VERBOSE", "true").lower() == "true",
+        # Non-interactive (e.g. parallel xdist workers) runs cannot answer input()
+        require_manual_confirmation=os.getenv("CNC_SKIP_PROMPT", "0") != "1",
+    )
+
+
+@lru_cache(maxsize=1)
+def list_serial_ports() -> tuple:
+    """Enumerate serial ports once per run - comports() walks sysfs/registry"""
+    import serial.tools.list_ports
     
-    return config
+    return tuple(serial.tools.list_ports.comports())
+
+
+@lru_cache(maxsize=None)
+def _is_port_present(port: str) -> bool:
+    """Check the shared port listing once per port name"""
+    # POSIX device path with no node - nothing plugged in, skip the enumeration
+    if port.startswith('/') and not os.path.exists(port):
+        return False
+    return any(p.device == port for p in list_serial_ports())
 
 
 def is_hardware_available() -> bool:
     """Check if hardware is available for testing"""
-    import serial.tools.list_ports
-    
-    config = get_hardware_config()
-    available_ports = [port.device for port in serial.tools.list_ports.comports()]
-    
-    return config.port in available_ports
+    return _is_port_present(get_hardware_config().port)
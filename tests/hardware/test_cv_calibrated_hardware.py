@@ -5,19 +5,28 @@ import unittest
 import sys
 import os
 import time
-import cv2
-import numpy as np
+import threading
+from collections import deque
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from cv import CalibratedCameraManager, CameraEvents
+# Bound by _import_cv() from setUpClass - collection and skipped runs never load NumPy/OpenCV
+np = CalibratedCameraManager = CameraEvents = None
+
+
+def _import_cv():
+    global np, CalibratedCameraManager, CameraEvents
+    import numpy as np
+    from cv import CalibratedCameraManager, CameraEvents
 
 
 class TestCalibratedCameraManagerHardware(unittest.TestCase):
     """Hardware tests for CalibratedCameraManager - requires physical camera"""
     
     CALIBRATION_FILE = "data/calibration/endo.npz"
+    MAX_EVENTS = 128  # Bound on recorded events - frame events can flood a stress run
+    HW_GROUP = "camera"  # Shares /dev/video0 - one xdist worker per group
     
     @classmethod
     def setUpClass(cls):
@@ -26,48 +35,94 @@ class TestCalibratedCameraManagerHardware(unittest.TestCase):
         print("HARDWARE TEST - CalibratedCameraManager")
         print("="*60)
         
-        # Check camera
-        cap = cv2.VideoCapture(0)
-        cls.camera_available = cap.isOpened()
-        if cls.camera_available:
-            ret, _ = cap.read()
-            cls.camera_available = ret
-        cap.release()
-        
-        if not cls.camera_available:
-            raise unittest.SkipTest("No camera detected - skipping hardware tests")
-        
-        print("✓ Camera detected")
-        
         # Check calibration file
         if not os.path.exists(cls.CALIBRATION_FILE):
             raise unittest.SkipTest(f"Calibration file not found: {cls.CALIBRATION_FILE}")
         
         print(f"✓ Calibration file found: {cls.CALIBRATION_FILE}")
+        _import_cv()
         
-        # Verify calibration file format
+        # Verify calibration file format - keep the arrays so tests that are
+        # not about the loader skip re-inflating the archive
         try:
-            data = np.load(cls.CALIBRATION_FILE)
-            if "camera_matrix" not in data or "dist_coeffs" not in data:
-                raise unittest.SkipTest("Invalid calibration file format")
+            with np.load(cls.CALIBRATION_FILE) as data:
+                if "camera_matrix" not in data or "dist_coeffs" not in data:
+                    raise unittest.SkipTest("Invalid calibration file format")
+                cls._cached_matrix = np.ascontiguousarray(data['camera_matrix'])
+                cls._cached_dist = np.ascontiguousarray(data['dist_coeffs'])
+            
+            # Validate the cached arrays once - every test reuses them
+            if cls._cached_matrix.shape != (3, 3) or cls._cached_dist.size < 4:
+                raise unittest.SkipTest("Invalid calibration array shapes")
+            cls._cached_matrix.setflags(write=False)  # Shared by all tests
+            cls._cached_dist.setflags(write=False)
             print(f"✓ Calibration file format valid")
-            print(f"  - Camera matrix shape: {data['camera_matrix'].shape}")
-            print(f"  - Distortion coeffs shape: {data['dist_coeffs'].shape}")
+            print(f"  - Camera matrix shape: {cls._cached_matrix.shape}")
+            print(f"  - Distortion coeffs shape: {cls._cached_dist.shape}")
+        except unittest.SkipTest:
+            raise
         except Exception as e:
             raise unittest.SkipTest(f"Error reading calibration file: {e}")
         
+        # Check camera - the shared connection doubles as the probe, so the device
+        # is opened once, through connect() (CAP_PROP_BUFFERSIZE=1, test read).
+        # Tests that exercise connect/disconnect borrow it via _private_manager()
+        cls.shared_manager = CalibratedCameraManager(camera_id=0, resolution=(640, 480))
+        cls.camera_available = cls.shared_manager.connect()
+        if not cls.camera_available:
+            raise unittest.SkipTest("No camera detected - skipping hardware tests")
+        
+        print("✓ Camera detected")
         print()
     
+    @classmethod
+    def tearDownClass(cls):
+        """Release the shared camera connection"""
+        cls.shared_manager.disconnect()
+    
     def setUp(self):
-        """Create calibrated camera manager for each test"""
-        self.manager = CalibratedCameraManager(camera_id=0, resolution=(640, 480))
-        self.events_received = []
+        """Reset the shared calibrated camera manager for each test"""
+        self.manager = self.shared_manager
+        if not self.manager.is_connected:
+            self.manager.connect()
+        
+        # Start every test uncalibrated with no test listeners attached
+        self.manager.camera_matrix = None
+        self.manager.dist_coeffs = None
+        self.manager._calibration_file = None
+        self.manager.emit_frame_events = True
+        self._baseline_subscriptions = len(self.manager._subscriptions)
+        
+        self.manager.capture_frame()  # Drain a stale buffered frame
+        self.events_received = deque(maxlen=self.MAX_EVENTS)
     
     def tearDown(self):
         """Clean up after each test"""
-        if self.manager.is_connected:
-            self.manager.disconnect()
-        time.sleep(0.1)
+        for event_type, subscription_id in self.manager._subscriptions[self._baseline_subscriptions:]:
+            self.manager.stop_listening(event_type, subscription_id)
+        
+        if self.manager is not self.shared_manager:
+            if self.manager.is_connected:
+                self.manager.disconnect()
+            time.sleep(0.1)
+    
+    def _private_manager(self):
+        """Short-lived manager for tests that exercise connect/disconnect
+        
+        The shared connection is released first (most webcams allow one open
+        handle) and setUp of the next test reopens it.
+        """
+        self.shared_manager.disconnect()
+        self.manager = CalibratedCameraManager(camera_id=0, resolution=(640, 480))
+        self._baseline_subscriptions = 0
+        return self.manager
+    
+    def _load_cached_calibration(self):
+        """Inject the arrays read in setUpClass - same end state as load_calibration()"""
+        self.manager.camera_matrix = self._cached_matrix.copy()
+        self.manager.dist_coeffs = self._cached_dist.copy()
+        self.manager._calibration_file = self.CALIBRATION_FILE
+        self.manager.emit(CameraEvents.CALIBRATION_LOADED, self.CALIBRATION_FILE)
     
     def test_load_real_calibration(self):
         """Test loading real calibration file"""
@@ -93,9 +148,10 @@ class TestCalibratedCameraManagerHardware(unittest.TestCase):
     def test_calibrated_connection_lifecycle(self):
         """Test connection with calibration loaded"""
         print("Testing connection lifecycle with calibration...")
+        self._private_manager()
         
         # Load calibration first
-        self.manager.load_calibration(self.CALIBRATION_FILE)
+        self._load_cached_calibration()
         self.assertTrue(self.manager.is_calibrated())
         print("  ✓ Calibration loaded")
         
@@ -130,7 +186,7 @@ class TestCalibratedCameraManagerHardware(unittest.TestCase):
         print(f"  Info without calibration: {info}")
         
         # Load calibration
-        self.manager.load_calibration(self.CALIBRATION_FILE)
+        self._load_cached_calibration()
         
         # Get calibration info
         calib_info = self.manager.get_calibration_info()
@@ -141,42 +197,41 @@ class TestCalibratedCameraManagerHardware(unittest.TestCase):
     def test_calibration_events_with_hardware(self):
         """Test calibration events are emitted correctly"""
         print("Testing calibration events...")
+        self._private_manager()
         
-        events = []
+        events = deque(maxlen=self.MAX_EVENTS)
+        loaded_evt, connected_evt, frame_evt = threading.Event(), threading.Event(), threading.Event()
         
         def on_loaded(file_path):
             events.append(('loaded', file_path))
+            loaded_evt.set()
             print(f"    Event: CALIBRATION_LOADED - {file_path}")
         
         def on_connected(success):
             events.append(('connected', success))
+            connected_evt.set()
             print(f"    Event: CONNECTED - {success}")
         
         def on_frame(frame):
             events.append(('frame', frame is not None))
+            frame_evt.set()
         
         # Listen to events
         self.manager.listen(CameraEvents.CALIBRATION_LOADED, on_loaded)
         self.manager.listen(CameraEvents.CONNECTED, on_connected)
         self.manager.listen(CameraEvents.FRAME_CAPTURED, on_frame)
         
-        # Load calibration
+        # Each phase waits only as long as its event takes to arrive
         self.manager.load_calibration(self.CALIBRATION_FILE)
-        time.sleep(0.05)
+        self.assertTrue(loaded_evt.wait(timeout=1.0), "Should emit CALIBRATION_LOADED")
         
-        # Connect
         self.manager.connect()
-        time.sleep(0.05)
+        self.assertTrue(connected_evt.wait(timeout=1.0), "Should emit CONNECTED")
         
-        # Capture
         self.manager.capture_frame()
-        time.sleep(0.05)
+        self.assertTrue(frame_evt.wait(timeout=1.0), "Should emit FRAME_CAPTURED")
         
-        # Verify events
         event_types = [e[0] for e in events]
-        self.assertIn('loaded', event_types, "Should emit CALIBRATION_LOADED")
-        self.assertIn('connected', event_types, "Should emit CONNECTED")
-        self.assertIn('frame', event_types, "Should emit FRAME_CAPTURED")
         
         print(f"  ✓ Received {len(events)} events: {event_types}")
         
@@ -187,39 +242,37 @@ class TestCalibratedCameraManagerHardware(unittest.TestCase):
         print("Testing multiple frame captures with calibration...")
         
         # Load calibration
-        self.manager.load_calibration(self.CALIBRATION_FILE)
-        self.manager.connect()
+        self._load_cached_calibration()
+        self.manager.emit_frame_events = False  # No listeners - skip per-frame copy/publish
         
         frame_count = 20
         successful_captures = 0
-        frame_sizes = []
+        frames = None  # (frame_count, H, W, C) buffer, allocated on first frame
         
         for i in range(frame_count):
             frame = self.manager.capture_frame()
-            if frame is not None:
-                successful_captures += 1
-                frame_sizes.append(frame.shape)
+            if frame is None:
+                continue
+            if frames is None:
+                frames = np.empty((frame_count,) + frame.shape, dtype=frame.dtype)
+            # Fixed-shape buffer rejects any frame whose size differs from the first
+            frames[successful_captures] = frame
+            successful_captures += 1
         
         success_rate = (successful_captures / frame_count) * 100
         self.assertGreater(success_rate, 90, f"Success rate {success_rate}% should be > 90%")
         
-        # Verify all frames have same size
-        if frame_sizes:
-            first_size = frame_sizes[0]
-            all_same = all(size == first_size for size in frame_sizes)
-            self.assertTrue(all_same, "All frames should have same size")
-        
+        first_size = frames.shape[1:] if frames is not None else None
         print(f"  ✓ Captured {successful_captures}/{frame_count} frames ({success_rate:.1f}%)")
-        print(f"  ✓ Frame size: {frame_sizes[0] if frame_sizes else 'N/A'}")
-        
-        self.manager.disconnect()
+        print(f"  ✓ Frame size: {first_size or 'N/A'}")
     
     def test_reconnection_with_calibration(self):
         """Test reconnection while maintaining calibration"""
         print("Testing reconnection with calibration...")
+        self._private_manager()
         
         # Load calibration
-        self.manager.load_calibration(self.CALIBRATION_FILE)
+        self._load_cached_calibration()
         print("  ✓ Calibration loaded")
         
         # First connection
@@ -256,8 +309,8 @@ class TestCalibratedCameraManagerHardware(unittest.TestCase):
         """Test calibration matrix has reasonable values"""
         print("Testing calibration matrix values...")
         
-        self.manager.load_calibration(self.CALIBRATION_FILE)
-        matrix, dist = self.manager.get_calibration()
+        # Values only - read the arrays validated in setUpClass, no manager round-trip
+        matrix, dist = self._cached_matrix, self._cached_dist
         
         # Check matrix properties
         # Diagonal should be positive (focal lengths and principal point)
@@ -289,6 +342,7 @@ class TestCalibratedCameraManagerHardware(unittest.TestCase):
     def test_combined_functionality(self):
         """Integration test: full workflow with hardware and calibration"""
         print("Testing complete workflow...")
+        self._private_manager()
         
         workflow_steps = []
         
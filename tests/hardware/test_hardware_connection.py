@@ -53,9 +53,9 @@ class TestHardwareConnection(BaseHardwareTest):
         initial_status = self.controller.get_status()
         
         # Test status query (?) - should be very fast
-        start_time = time.time()
+        start_time = time.perf_counter()
         status = self.controller.get_status()
-        query_time = time.time() - start_time
+        query_time = time.perf_counter() - start_time
         
         self.assertLess(query_time, 1.0, "Status query took too long")
         self.assertIsInstance(status, str)
@@ -76,8 +76,7 @@ class TestHardwareConnection(BaseHardwareTest):
         log_with_timestamp(f"✅ Status after E-stop: {status}")
         
         # Reset to clear
-        self.controller.reset()
-        time.sleep(2)  # GRBL needs time to reset
+        self.controller.reset()  # Returns once GRBL prints its startup banner
         
         # Should be back to normal
         final_status = self.controller.get_status()
@@ -17,29 +17,21 @@ class TestHardwareMovement(BaseHardwareTest):
         # Test small movement in X
         result = self.safe_move_relative(x=1.0, feed_rate=300)
         self.assertTrue(result, "X+ movement failed")
-        
-        # Wait for movement to complete
         self.assertTrue(self.wait_for_idle(), "Movement did not complete")
-        
-        # Check position changed
         new_position = self.controller.get_position()
         self.assertGreater(new_position[0], initial_position[0], "X position did not increase")
         
-        # Return to start
-        self.safe_move_relative(x=-1.0, feed_rate=300)
-        self.wait_for_idle()
-        
         # Test Y axis
         result = self.safe_move_relative(y=1.0, feed_rate=300)
         self.assertTrue(result, "Y+ movement failed")
-        self.wait_for_idle()
-        
+        self.assertTrue(self.wait_for_idle(), "Movement did not complete")
         y_position = self.controller.get_position()
         self.assertGreater(y_position[1], initial_position[1], "Y position did not increase")
         
-        # Return to start
-        self.safe_move_relative(y=-1.0, feed_rate=300)
-        self.wait_for_idle()
+        # Return to start - both legs streamed as one sequence with a single wait for idle
+        result = self.safe_move_sequence([{'x': -1.0}, {'y': -1.0}], feed_rate=300)
+        self.assertTrue(result, "Return jog sequence failed")
+        self.assert_position_near(initial_position)
         
         print("✅ Small jog movements completed successfully")
     
@@ -79,22 +71,22 @@ class TestHardwareMovement(BaseHardwareTest):
     def test_feed_rate_control(self):
         """Test different feed rates"""
         # Test slow movement
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = self.safe_move_relative(x=2.0, feed_rate=60)  # 1mm/s
         self.assertTrue(result)
         self.wait_for_idle()
-        slow_time = time.time() - start_time
+        slow_time = time.perf_counter() - start_time
         
         # Return to start
         self.safe_move_relative(x=-2.0, feed_rate=300)
         self.wait_for_idle()
         
         # Test fast movement  
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = self.safe_move_relative(x=2.0, feed_rate=600)  # 10mm/s
         self.assertTrue(result)
         self.wait_for_idle()
-        fast_time = time.time() - start_time
+        fast_time = time.perf_counter() - start_time
         
         # Return to start
         self.safe_move_relative(x=-2.0, feed_rate=300)
@@ -172,8 +164,7 @@ class TestHardwareMovement(BaseHardwareTest):
         print(f"✅ Emergency stop effective - stopped at {stopped_position[0] - self.initial_position[0]:.2f}mm")
         
         # Reset and return to safe state
-        self.controller.reset()
-        time.sleep(2)
+        self.controller.reset()  # Returns once GRBL prints its startup banner
 
 
 if __name__ == '__main__':
@@ -48,11 +48,12 @@ class TestSmartTimeoutHardware(BaseHardwareTest):
         log_with_timestamp("Connecting with SmartTimeoutController...")
         if not cls.controller.connect(cls.config.port, cls.config.baudrate):
             raise unittest.SkipTest(f"Failed to connect to hardware on {cls.config.port}")
+        cls._connected = True
         
         log_with_timestamp(f"✅ Connected with SmartTimeoutController on {cls.config.port}")
         
-        # Wait for auto-configuration to complete
-        time.sleep(0.5)
+        # Auto-configuration ran inside connect() - CONNECTED handlers are called
+        # synchronously, so the single '$$' dump is already parsed here
         
         # Check if configuration was loaded
         if cls.controller._config_initialized:
@@ -67,7 +68,7 @@ class TestSmartTimeoutHardware(BaseHardwareTest):
     @classmethod
     def tearDownClass(cls):
         """Clean up hardware connection"""
-        if cls.controller and cls.controller.is_connected():
+        if cls._connected:
             # Get timeout statistics before disconnect
             stats = cls.controller.get_timeout_statistics()
             if stats.get('total_commands', 0) > 0:
@@ -77,10 +78,11 @@ class TestSmartTimeoutHardware(BaseHardwareTest):
                 log_with_timestamp(f"   Min accuracy: {stats.get('min_accuracy', 0):.2f}x")
                 log_with_timestamp(f"   Max accuracy: {stats.get('max_accuracy', 0):.2f}x")
             
-            # Emergency stop and disconnect
+            # Emergency stop and disconnect once motion has stopped
             cls.controller.emergency_stop()
-            time.sleep(0.5)
+            cls.wait_until(lambda: cls.controller.get_status() in cls.STOPPED_STATES, timeout=2.0)
             cls.controller.disconnect()
+            cls._connected = False
             log_with_timestamp("✅ Disconnected from hardware")
     
     def test_01_homing_with_smart_timeout(self):
@@ -98,17 +100,17 @@ class TestSmartTimeoutHardware(BaseHardwareTest):
         
         # Perform homing with smart timeout
         log_with_timestamp("🏠 Starting homing cycle...")
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             result = self.controller.home()
-            actual_time = time.time() - start_time
+            actual_time = time.perf_counter() - start_time
             
             log_with_timestamp(f"✅ Homing completed successfully in {actual_time:.2f}s")
             self.assertTrue(result, "Homing command should succeed")
             
-            # Wait for machine to settle
-            time.sleep(1.0)
+            # Wait for machine to settle - returns on the first Idle report
+            self.wait_for_idle(timeout=2.0)
             
             # Verify machine is at home position (should be close to 0,0,0 in machine coordinates)
             final_position = self.controller.get_position()
@@ -126,12 +128,12 @@ class TestSmartTimeoutHardware(BaseHardwareTest):
             log_with_timestamp("✅ Homing test completed successfully")
             
         except TimeoutError as e:
-            actual_time = time.time() - start_time
+            actual_time = time.perf_counter() - start_time
             log_with_timestamp(f"❌ Homing TIMEOUT after {actual_time:.2f}s")
             self.fail(f"Homing timeout error: {e}")
         
         except Exception as e:
-            actual_time = time.time() - start_time
+            actual_time = time.perf_counter() - start_time
             log_with_timestamp(f"❌ Homing FAILED after {actual_time:.2f}s: {e}")
             raise
     
@@ -149,8 +151,9 @@ class TestSmartTimeoutHardware(BaseHardwareTest):
         target_y = initial_position[1] + 0.0
         target_z = initial_position[2] + 0.0
         
-        # Calculate expected timeout
-        command = f"G0 X{target_x:.3f} Y{target_y:.3f} Z{target_z:.3f}"
+        # Calculate expected timeout - same formatter as move_to(), so the
+        # calculator's memo serves the move's own lookup
+        command = GRBLController.MOVE_FORMAT(target_x, target_y, target_z)
         calculated_timeout = self.controller._timeout_calc.calculate_timeout(
             command,
             self.controller._get_current_position_4axis()
@@ -159,11 +162,11 @@ class TestSmartTimeoutHardware(BaseHardwareTest):
         
         # Execute movement
         log_with_timestamp(f"🎯 Moving to X={target_x:.1f} Y={target_y:.1f} Z={target_z:.1f}")
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             result = self.controller.move_to(target_x, target_y, target_z)
-            actual_time = time.time() - start_time
+            actual_time = time.perf_counter() - start_time
             
             log_with_timestamp(f"✅ Movement completed in {actual_time:.2f}s")
             self.assertTrue(result, "Movement should succeed")
@@ -187,7 +190,7 @@ class TestSmartTimeoutHardware(BaseHardwareTest):
             log_with_timestamp("✅ Movement test completed successfully")
             
         except TimeoutError as e:
-            actual_time = time.time() - start_time
+            actual_time = time.perf_counter() - start_time
             log_with_timestamp(f"❌ Movement TIMEOUT after {actual_time:.2f}s")
             self.fail(f"Movement timeout - actual: {actual_time:.2f}s, calculated: {calculated_timeout:.1f}s")
         
@@ -209,11 +212,11 @@ class TestSmartTimeoutHardware(BaseHardwareTest):
         feed_rate = 500.0  # mm/min
         
         log_with_timestamp(f"🎯 Jogging {jog_distance}mm at {feed_rate} mm/min")
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             result = self.controller.jog_relative(x=jog_distance, feed_rate=feed_rate)
-            actual_time = time.time() - start_time
+            actual_time = time.perf_counter() - start_time
             
             log_with_timestamp(f"✅ Jog completed in {actual_time:.2f}s")
             self.assertTrue(result, "Jog should succeed")
@@ -5,12 +5,20 @@ import unittest
 import sys
 import os
 import time
-import cv2
+import glob
+import threading
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from cv import CameraManager, CameraEvents
+# Bound by _import_cv() from setUpClass - a no-camera run never loads OpenCV
+cv2 = CameraManager = CameraEvents = None
+
+
+def _import_cv():
+    global cv2, CameraManager, CameraEvents
+    import cv2
+    from cv import CameraManager, CameraEvents
 
 
 class TestCameraManagerHardware(unittest.TestCase):
@@ -23,6 +31,11 @@ class TestCameraManagerHardware(unittest.TestCase):
         print("HARDWARE TEST - Checking for camera availability")
         print("="*60)
         
+        # No video device node on Linux - skip before paying for the OpenCV import
+        if sys.platform.startswith('linux') and not glob.glob('/dev/video*'):
+            raise unittest.SkipTest("No camera detected - skipping hardware tests")
+        _import_cv()
+        
         # Try to detect camera
         cap = cv2.VideoCapture(0)
         cls.camera_available = cap.isOpened()
@@ -99,12 +112,16 @@ class TestCameraManagerHardware(unittest.TestCase):
         
         self.manager.connect()
         
+        self.manager.emit_frame_events = False  # Success rate only - no per-frame copies
+        
         frame_count = 10
         successful_captures = 0
+        buffer = None  # Reused once the first frame fixes the shape
         
         for i in range(frame_count):
-            frame = self.manager.capture_frame()
+            frame = self.manager.capture_frame(buffer)
             if frame is not None:
+                buffer = frame
                 successful_captures += 1
         
         success_rate = (successful_captures / frame_count) * 100
@@ -163,38 +180,36 @@ class TestCameraManagerHardware(unittest.TestCase):
         """Test that events are emitted correctly"""
         print("Testing event emission...")
         
+        connected_evt, frame_evt, disconnected_evt = threading.Event(), threading.Event(), threading.Event()
+        
         # Listen to events
         def on_connected(success):
             self.events_received.append(('connected', success))
+            connected_evt.set()
         
         def on_disconnected():
             self.events_received.append(('disconnected',))
+            disconnected_evt.set()
         
         def on_frame_captured(frame):
             self.events_received.append(('frame_captured', frame is not None))
+            frame_evt.set()
         
         self.manager.listen(CameraEvents.CONNECTED, on_connected)
         self.manager.listen(CameraEvents.DISCONNECTED, on_disconnected)
         self.manager.listen(CameraEvents.FRAME_CAPTURED, on_frame_captured)
         
-        # Connect
+        # Each phase waits only as long as its event takes to arrive
         self.manager.connect()
-        time.sleep(0.05)  # Allow event processing
+        self.assertTrue(connected_evt.wait(timeout=0.2), "Should emit CONNECTED event")
         
-        # Capture
         self.manager.capture_frame()
-        time.sleep(0.05)
+        self.assertTrue(frame_evt.wait(timeout=0.2), "Should emit FRAME_CAPTURED event")
         
-        # Disconnect
         self.manager.disconnect()
-        time.sleep(0.05)
+        self.assertTrue(disconnected_evt.wait(timeout=0.2), "Should emit DISCONNECTED event")
         
-        # Verify events
         event_types = [e[0] for e in self.events_received]
-        self.assertIn('connected', event_types, "Should emit CONNECTED event")
-        self.assertIn('disconnected', event_types, "Should emit DISCONNECTED event")
-        self.assertIn('frame_captured', event_types, "Should emit FRAME_CAPTURED event")
-        
         print(f"  ✓ Received events: {event_types}")
     
     def test_reconnection(self):
@@ -5,19 +5,21 @@ Safely execute hardware tests with proper setup and safety checks
 """
 import os
 import sys
-import serial.tools.list_ports
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
 
 # Add project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from hardware.test_config import get_hardware_config, is_hardware_available
+# Same module the test classes import, so the port probe cache is shared with them
+from tests.hardware.test_config import get_hardware_config, is_hardware_available, list_serial_ports
 
 
 def list_available_ports():
     """List all available serial ports"""
-    ports = list(serial.tools.list_ports.comports())
+    ports = list_serial_ports()  # Reused by every is_hardware_available() check
     if not ports:
         print("❌ No serial ports found")
         return []
@@ -51,7 +53,7 @@ def configure_test_environment():
             choice = input(f"\nSelect port number (1-{len(ports)}) or press Enter for default [{config.port}]: ")
             if choice.strip():
                 port_index = int(choice) - 1
-                config.port = ports[port_index].device
+                config = replace(config, port=ports[port_index].device)
                 print(f"Selected port: {config.port}")
         except (ValueError, IndexError):
             print("Invalid choice, using default port")
@@ -60,6 +62,9 @@ def configure_test_environment():
     os.environ["CNC_TEST_PORT"] = config.port
     os.environ["CNC_TEST_BAUDRATE"] = str(config.baudrate)
     
+    # Cached config must pick up the selection - port probes are cached per port
+    get_hardware_config.cache_clear()
+    
     return config
 
 
@@ -88,6 +93,21 @@ def run_safety_checklist():
     return True
 
 
+def run_by_device(test_classes):
+    """Run classes sharing an HW_GROUP serially, different devices concurrently"""
+    loader = unittest.TestLoader()
+    groups = {}
+    for test_class in test_classes:
+        suite = groups.setdefault(getattr(test_class, 'HW_GROUP', None), unittest.TestSuite())
+        suite.addTests(loader.loadTestsFromTestCase(test_class))
+    
+    runner = unittest.TextTestRunner(verbosity=2, buffer=False)
+    if len(groups) == 1:
+        return [runner.run(suite) for suite in groups.values()]
+    with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+        return list(pool.map(runner.run, groups.values()))
+
+
 def run_hardware_tests():
     """Run hardware tests with safety measures"""
     
@@ -120,30 +140,22 @@ def run_hardware_tests():
     
     # Run tests
     try:
-        # Load test suite
-        loader = unittest.TestLoader()
-        suite = unittest.TestSuite()
-
-        # Add connection tests
         from tests.hardware.test_hardware_connection import TestHardwareConnection
-        suite.addTests(loader.loadTestsFromTestCase(TestHardwareConnection))
-        
-        # Add movement tests
         from tests.hardware.test_hardware_movement import TestHardwareMovement
-        suite.addTests(loader.loadTestsFromTestCase(TestHardwareMovement))
         
-        # Run tests with verbose output
-        runner = unittest.TextTestRunner(verbosity=2, buffer=False)
-        result = runner.run(suite)
+        # Both classes drive the CNC ("cnc" group) so they run one after the other
+        results = run_by_device([TestHardwareConnection, TestHardwareMovement])
+        failures = sum(len(result.failures) for result in results)
+        errors = sum(len(result.errors) for result in results)
         
         # Summary
         print("\n" + "=" * 50)
-        if result.wasSuccessful():
+        if not failures and not errors:
             print("✅ All hardware tests passed!")
         else:
-            print(f"❌ {len(result.failures)} failures, {len(result.errors)} errors")
+            print(f"❌ {failures} failures, {errors} errors")
             
-        return result.wasSuccessful()
+        return not failures and not errors
         
     except KeyboardInterrupt:
         print("\n⚠️  Tests interrupted by user")